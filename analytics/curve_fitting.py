@@ -1,67 +1,278 @@
 """Curve fitting utilities for ELISA calibration."""
 import math
 from dataclasses import dataclass
-from typing import Callable, Dict, Iterable, List, Tuple
+from functools import lru_cache, partial
+from multiprocessing import Pool
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Union
 
-import importlib.util
+import numpy as np
+from scipy import optimize
+from threadpoolctl import threadpool_limits
+
+try:
+    import numba
+except ImportError:  # pragma: no cover - numba is an optional accelerator
+    numba = None
 
 
 @dataclass
 class FitResult:
+    """Fitted model with predictions stored column-wise as ``xs``/``ys`` arrays."""
+
     model: str
     parameters: Dict[str, float]
     r_squared: float
-    predictions: List[Tuple[float, float]]
+    xs: np.ndarray
+    ys: np.ndarray
     converged: bool
     status: str
 
+    @property
+    def predictions(self) -> List[Tuple[float, float]]:
+        return list(zip(self.xs.tolist(), self.ys.tolist()))
+
+    def __eq__(self, other: object) -> bool:
+        # The generated __eq__ would compare the arrays element-wise and fail on truthiness.
+        if not isinstance(other, FitResult):
+            return NotImplemented
+        return (
+            (self.model, self.parameters, self.r_squared, self.converged, self.status)
+            == (other.model, other.parameters, other.r_squared, other.converged, other.status)
+            and np.array_equal(self.xs, other.xs)
+            and np.array_equal(self.ys, other.ys)
+        )
+
+
+_LEAST_SQUARES_STATUS = {
+    -1: "Improper input parameters",
+    0: "Maximum iterations reached",
+    1: "Converged by gradient tolerance",
+    2: "Converged by tolerance",
+    3: "Converged by step tolerance",
+    4: "Converged by tolerance",
+}
+
+_BOUNDS_4PL = (
+    [-math.inf, 0.0, 1e-6, -math.inf],
+    [math.inf, math.inf, math.inf, math.inf],
+)
+_BOUNDS_5PL = (
+    [-math.inf, 0.0, 1e-6, -math.inf, 1e-6],
+    [math.inf, math.inf, math.inf, math.inf, math.inf],
+)
+
+
+def four_parameter_logistic(
+    x: Union[float, np.ndarray], a: float, b: float, c: float, d: float
+) -> np.ndarray:
+    x = np.asarray(x, dtype=np.float64)
+    return d + (a - d) / (1.0 + (x / c) ** b)
+
+
+def five_parameter_logistic(
+    x: Union[float, np.ndarray], a: float, b: float, c: float, d: float, g: float
+) -> np.ndarray:
+    x = np.asarray(x, dtype=np.float64)
+    return d + (a - d) / ((1.0 + (x / c) ** b) ** g)
+
+
+def _predict_4pl(log_x: np.ndarray, a: float, b: float, c: float, d: float) -> np.ndarray:
+    """4PL evaluated from precomputed ``log(x)``: ``(x / c) ** b == exp(b * (log(x) - log(c)))``."""
+    t = np.exp(b * (log_x - math.log(c)))
+    return d + (a - d) / (1.0 + t)
+
+
+def _predict_5pl(log_x: np.ndarray, a: float, b: float, c: float, d: float, g: float) -> np.ndarray:
+    t = np.exp(b * (log_x - math.log(c)))
+    return d + (a - d) * np.exp(-g * np.log1p(t))
+
+
+def _jacobian_5pl(log_x: np.ndarray, a: float, b: float, c: float, d: float, g: float) -> np.ndarray:
+    """Partial derivatives of the 5PL model, one row per point and one column per parameter.
+
+    With ``u = (x / c) ** b``: d/da = (1 + u) ** -g, d/dd = 1 - d/da,
+    d/db = -(a - d) * g * (1 + u) ** (-g - 1) * u * ln(x / c),
+    d/dc = (a - d) * g * (1 + u) ** (-g - 1) * u * b / c and
+    d/dg = -(a - d) * ln(1 + u) * (1 + u) ** -g. 4PL is the ``g = 1`` case.
+    """
+    log_ratio = log_x - math.log(c)
+    u = np.exp(b * log_ratio)
+    log_base = np.log1p(u)
+    inv_v = np.exp(-g * log_base)
+    common = (a - d) * g * inv_v / (1.0 + u) * u
+    return np.column_stack(
+        (
+            inv_v,
+            -common * log_ratio,
+            common * b / c,
+            1.0 - inv_v,
+            -(a - d) * log_base * inv_v,
+        )
+    )
+
+
+def _jacobian_4pl(log_x: np.ndarray, a: float, b: float, c: float, d: float) -> np.ndarray:
+    return _jacobian_5pl(log_x, a, b, c, d, 1.0)[:, :4]
+
+
+def _predict_4pl_loop(log_x: np.ndarray, a: float, b: float, c: float, d: float) -> np.ndarray:
+    out = np.empty_like(log_x)
+    log_c = math.log(c)
+    for i in range(log_x.size):
+        out[i] = d + (a - d) / (1.0 + math.exp(b * (log_x[i] - log_c)))
+    return out
 
-def four_parameter_logistic(x: float, a: float, b: float, c: float, d: float) -> float:
-    return d + (a - d) / (1 + (x / c) ** b)
 
+def _predict_5pl_loop(log_x: np.ndarray, a: float, b: float, c: float, d: float, g: float) -> np.ndarray:
+    out = np.empty_like(log_x)
+    log_c = math.log(c)
+    for i in range(log_x.size):
+        out[i] = d + (a - d) * math.exp(-g * math.log1p(math.exp(b * (log_x[i] - log_c))))
+    return out
 
-def five_parameter_logistic(x: float, a: float, b: float, c: float, d: float, g: float) -> float:
-    return d + (a - d) / ((1 + (x / c) ** b) ** g)
 
+def _jacobian_5pl_loop(log_x: np.ndarray, a: float, b: float, c: float, d: float, g: float) -> np.ndarray:
+    jac = np.empty((log_x.size, 5))
+    log_c = math.log(c)
+    for i in range(log_x.size):
+        log_ratio = log_x[i] - log_c
+        u = math.exp(b * log_ratio)
+        log_base = math.log1p(u)
+        inv_v = math.exp(-g * log_base)
+        common = (a - d) * g * inv_v / (1.0 + u) * u
+        jac[i, 0] = inv_v
+        jac[i, 1] = -common * log_ratio
+        jac[i, 2] = common * b / c
+        jac[i, 3] = 1.0 - inv_v
+        jac[i, 4] = -(a - d) * log_base * inv_v
+    return jac
 
-def _r_squared(observed: List[float], predicted: List[float]) -> float:
-    mean_obs = sum(observed) / len(observed)
-    ss_tot = sum((o - mean_obs) ** 2 for o in observed)
-    ss_res = sum((o - p) ** 2 for o, p in zip(observed, predicted))
-    return 1 - ss_res / ss_tot if ss_tot else 0.0
 
+# The fits call these kernels: fused per-point loops compiled by Numba when it is
+# installed, otherwise the vectorized NumPy implementations above.
+if numba is not None:
+    _jit = numba.njit(cache=True, fastmath=True)
+    _predict_4pl_kernel = _jit(_predict_4pl_loop)
+    _predict_5pl_kernel = _jit(_predict_5pl_loop)
+    _jacobian_5pl_kernel = _jit(_jacobian_5pl_loop)
+else:  # pragma: no cover - depends on numba availability
+    _predict_4pl_kernel = _predict_4pl
+    _predict_5pl_kernel = _predict_5pl
+    _jacobian_5pl_kernel = _jacobian_5pl
 
-def _finite_difference(func: Callable[[List[float]], float], params: List[float], epsilon: float = 1e-4) -> List[float]:
-    gradients = []
-    for idx, value in enumerate(params):
-        params[idx] = value + epsilon
-        plus = func(params)
-        params[idx] = value - epsilon
-        minus = func(params)
-        params[idx] = value
-        gradients.append((plus - minus) / (2 * epsilon))
-    return gradients
 
+def _jacobian_4pl_kernel(log_x: np.ndarray, a: float, b: float, c: float, d: float) -> np.ndarray:
+    return _jacobian_5pl_kernel(log_x, a, b, c, d, 1.0)[:, :4]
+
+
+def _r_squared(observed: np.ndarray, predicted: np.ndarray) -> float:
+    ss_res = float(np.sum((observed - predicted) ** 2))
+    ss_tot = float(np.sum((observed - observed.mean()) ** 2))
+    return 1.0 - ss_res / ss_tot if ss_tot else 0.0
+
+
+def _least_squares(
+    model: Callable[..., np.ndarray],
+    jacobian: Callable[..., np.ndarray],
+    log_x: np.ndarray,
+    y_arr: np.ndarray,
+    initial_params: Sequence[float],
+    bounds: Tuple[Sequence[float], Sequence[float]],
+    max_iterations: int,
+    tolerance: float,
+) -> Tuple[List[float], np.ndarray, bool, str]:
+    """Run trust-region least squares; predictions come from the final residuals."""
+    result = optimize.least_squares(
+        lambda p: model(log_x, *p) - y_arr,
+        initial_params,
+        jac=lambda p: jacobian(log_x, *p),
+        method="trf",
+        bounds=bounds,
+        max_nfev=max_iterations,
+        ftol=tolerance,
+        xtol=tolerance,
+        gtol=tolerance,
+    )
+    status = _LEAST_SQUARES_STATUS.get(result.status, result.message)
+    predicted = y_arr + result.fun
+    return result.x.tolist(), predicted, bool(result.success), status
 
-def _gradient_descent(
-    loss_fn: Callable[[List[float]], float],
-    initial_params: List[float],
-    learning_rate: float = 1e-3,
-    max_iterations: int = 500,
-    tolerance: float = 1e-6,
-) -> Tuple[List[float], bool, str]:
-    params = list(initial_params)
-    previous_loss = loss_fn(params)
-    for iteration in range(max_iterations):
-        grads = _finite_difference(loss_fn, params)
-        if max(abs(g) for g in grads) < tolerance:
-            return params, True, "Converged by gradient tolerance"
-        params = [p - learning_rate * g for p, g in zip(params, grads)]
-        current_loss = loss_fn(params)
-        if abs(previous_loss - current_loss) < tolerance:
-            return params, True, "Converged by tolerance"
-        previous_loss = current_loss
-    return params, False, "Maximum iterations reached"
+
+def _basinhopping(
+    model: Callable[..., np.ndarray],
+    jacobian: Callable[..., np.ndarray],
+    log_x: np.ndarray,
+    y_arr: np.ndarray,
+    initial_params: Sequence[float],
+    bounds: Tuple[Sequence[float], Sequence[float]],
+    max_iterations: int,
+    tolerance: float,
+    niter: int,
+    temperature: float,
+    stepsize: float,
+    seed: Optional[int],
+) -> Tuple[List[float], np.ndarray, bool, str]:
+    """Global search: Metropolis hops around bounded L-BFGS-B minimizations of the sum of squares."""
+
+    def loss_and_gradient(p: np.ndarray) -> Tuple[float, np.ndarray]:
+        residuals = model(log_x, *p) - y_arr
+        return float(residuals @ residuals), 2.0 * jacobian(log_x, *p).T @ residuals
+
+    lower, upper = bounds
+    result = optimize.basinhopping(
+        loss_and_gradient,
+        initial_params,
+        niter=niter,
+        T=temperature,
+        stepsize=stepsize,
+        minimizer_kwargs={
+            "method": "L-BFGS-B",
+            "jac": True,
+            "bounds": optimize.Bounds(lower, upper),
+            "options": {"maxfun": max_iterations, "ftol": tolerance, "gtol": tolerance},
+        },
+        seed=seed,
+    )
+    local = result.lowest_optimization_result
+    if local.success:
+        status = "Converged by basin-hopping"
+    else:
+        status = f"Basin-hopping failed: {local.message}"
+    predicted = model(log_x, *result.x)
+    return result.x.tolist(), predicted, bool(local.success), status
+
+
+def _solve(
+    backend: str,
+    model: Callable[..., np.ndarray],
+    jacobian: Callable[..., np.ndarray],
+    log_x: np.ndarray,
+    y_arr: np.ndarray,
+    initial_params: Sequence[float],
+    bounds: Tuple[Sequence[float], Sequence[float]],
+    max_iterations: int,
+    tolerance: float,
+    niter: int,
+    temperature: float,
+    stepsize: float,
+    seed: Optional[int],
+) -> Tuple[List[float], np.ndarray, bool, str]:
+    if backend == "basinhopping":
+        return _basinhopping(
+            model,
+            jacobian,
+            log_x,
+            y_arr,
+            initial_params,
+            bounds,
+            max_iterations,
+            tolerance,
+            niter=niter,
+            temperature=temperature,
+            stepsize=stepsize,
+            seed=seed,
+        )
+    return _least_squares(model, jacobian, log_x, y_arr, initial_params, bounds, max_iterations, tolerance)
 
 
 def _validate_inputs(xs: Iterable[float], ys: Iterable[float]) -> Tuple[List[float], List[float]]:
@@ -76,12 +287,28 @@ def _validate_inputs(xs: Iterable[float], ys: Iterable[float]) -> Tuple[List[flo
     return x_list, y_list
 
 
-def _maybe_import_scipy_optimize():
-    if importlib.util.find_spec("scipy") is None:
-        return None
-    from scipy import optimize  # type: ignore
+@lru_cache(maxsize=32)
+def _prepare_concentrations(x_values: Tuple[float, ...]) -> Tuple[np.ndarray, np.ndarray]:
+    """Read-only ``x`` and ``log(x)`` arrays, shared by repeated fits of the same standards series."""
+    x_arr = np.array(x_values, dtype=np.float64)
+    log_x = np.log(x_arr)
+    x_arr.setflags(write=False)
+    log_x.setflags(write=False)
+    return x_arr, log_x
+
 
-    return optimize
+def _initial_guess(x_list: List[float], y_list: List[float]) -> List[float]:
+    """Heuristic 4PL start: asymptotes from the signal range, midpoint at the mean concentration."""
+    return [min(y_list), 1.0, max(sum(x_list) / len(x_list), 1e-6), max(y_list)]
+
+
+# "scipy" is the historical name of the local SciPy fit and stays an alias of "least_squares".
+_BACKENDS = ("auto", "least_squares", "scipy", "basinhopping")
+
+
+def _validate_backend(backend: str) -> None:
+    if backend not in _BACKENDS:
+        raise ValueError(f"Unknown fitting backend: {backend}")
 
 
 def fit_4pl(
@@ -89,61 +316,42 @@ def fit_4pl(
     ys: Iterable[float],
     *,
     backend: str = "auto",
-    learning_rate: float = 5e-4,
-    max_iterations: int = 4000,
-    tolerance: float = 1e-6,
+    max_iterations: int = 5000,
+    tolerance: float = 1e-8,
+    niter: int = 50,
+    temperature: float = 1.0,
+    stepsize: float = 0.5,
+    seed: Optional[int] = None,
+    p0: Optional[Sequence[float]] = None,
 ) -> FitResult:
+    _validate_backend(backend)
     x_list, y_list = _validate_inputs(xs, ys)
-    a0 = min(y_list)
-    d0 = max(y_list)
-    c0 = sum(x_list) / len(x_list)
-    b0 = 1.0
-
-    optimize = _maybe_import_scipy_optimize()
-    use_scipy = backend == "scipy" or (backend == "auto" and optimize is not None)
-
-    if use_scipy and optimize is not None:
-        try:
-            params, _ = optimize.curve_fit(
-                four_parameter_logistic,
-                x_list,
-                y_list,
-                p0=[a0, b0, max(c0, 1e-6), d0],
-                bounds=(
-                    [-math.inf, 0.0, 1e-6, -math.inf],
-                    [math.inf, math.inf, math.inf, math.inf],
-                ),
-                maxfev=5000,
-            )
-            status = "SciPy backend converged"
-            converged = True
-        except Exception as exc:  # pragma: no cover - error path depends on SciPy availability
-            params = [a0, b0, c0, d0]
-            status = f"SciPy backend failed: {exc}"
-            converged = False
-    else:
-        params, converged, status = _gradient_descent(
-            loss_fn=lambda p: sum(
-                (
-                    four_parameter_logistic(x, p[0], p[1], p[2], p[3])
-                    - y
-                )
-                ** 2
-                for x, y in zip(x_list, y_list)
-            ),
-            initial_params=[a0, b0, max(c0, 1e-6), d0],
-            learning_rate=learning_rate,
-            max_iterations=max_iterations,
-            tolerance=tolerance,
-        )
+    x_arr, log_x = _prepare_concentrations(tuple(x_list))
+    y_arr = np.asarray(y_list, dtype=np.float64)
+
+    params, predicted, converged, status = _solve(
+        backend,
+        _predict_4pl_kernel,
+        _jacobian_4pl_kernel,
+        log_x,
+        y_arr,
+        initial_params=list(p0) if p0 is not None else _initial_guess(x_list, y_list),
+        bounds=_BOUNDS_4PL,
+        max_iterations=max_iterations,
+        tolerance=tolerance,
+        niter=niter,
+        temperature=temperature,
+        stepsize=stepsize,
+        seed=seed,
+    )
     a, b, c, d = params
-    predictions = [(x, four_parameter_logistic(x, a, b, c, d)) for x in x_list]
-    r2 = _r_squared(y_list, [p for _, p in predictions])
+    r2 = _r_squared(y_arr, predicted)
     return FitResult(
         model="4PL",
         parameters={"a": a, "b": b, "c": c, "d": d},
         r_squared=r2,
-        predictions=predictions,
+        xs=x_arr,
+        ys=predicted,
         converged=converged,
         status=status,
     )
@@ -154,81 +362,142 @@ def fit_5pl(
     ys: Iterable[float],
     *,
     backend: str = "auto",
-    learning_rate: float = 5e-4,
-    max_iterations: int = 8000,
-    tolerance: float = 1e-6,
+    max_iterations: int = 7000,
+    tolerance: float = 1e-8,
+    niter: int = 50,
+    temperature: float = 1.0,
+    stepsize: float = 0.5,
+    seed: Optional[int] = None,
+    p0: Optional[Sequence[float]] = None,
 ) -> FitResult:
+    _validate_backend(backend)
     x_list, y_list = _validate_inputs(xs, ys)
-    a0 = min(y_list)
-    d0 = max(y_list)
-    c0 = sum(x_list) / len(x_list)
-    b0 = 1.0
-    g0 = 1.0
-
-    optimize = _maybe_import_scipy_optimize()
-    use_scipy = backend == "scipy" or (backend == "auto" and optimize is not None)
-
-    if use_scipy and optimize is not None:
-        try:
-            params, _ = optimize.curve_fit(
-                five_parameter_logistic,
-                x_list,
-                y_list,
-                p0=[a0, b0, max(c0, 1e-6), d0, g0],
-                bounds=(
-                    [-math.inf, 0.0, 1e-6, -math.inf, 1e-6],
-                    [math.inf, math.inf, math.inf, math.inf, math.inf],
-                ),
-                maxfev=7000,
-            )
-            status = "SciPy backend converged"
-            converged = True
-        except Exception as exc:  # pragma: no cover - error path depends on SciPy availability
-            params = [a0, b0, max(c0, 1e-6), d0, g0]
-            status = f"SciPy backend failed: {exc}"
-            converged = False
-    else:
-        params, converged, status = _gradient_descent(
-            loss_fn=lambda p: sum(
-                (
-                    five_parameter_logistic(x, p[0], p[1], p[2], p[3], p[4])
-                    - y
-                )
-                ** 2
-                for x, y in zip(x_list, y_list)
-            ),
-            initial_params=[a0, b0, max(c0, 1e-6), d0, g0],
-            learning_rate=learning_rate,
-            max_iterations=max_iterations,
-            tolerance=tolerance,
-        )
+    x_arr, log_x = _prepare_concentrations(tuple(x_list))
+    y_arr = np.asarray(y_list, dtype=np.float64)
+
+    params, predicted, converged, status = _solve(
+        backend,
+        _predict_5pl_kernel,
+        _jacobian_5pl_kernel,
+        log_x,
+        y_arr,
+        initial_params=list(p0) if p0 is not None else _initial_guess(x_list, y_list) + [1.0],
+        bounds=_BOUNDS_5PL,
+        max_iterations=max_iterations,
+        tolerance=tolerance,
+        niter=niter,
+        temperature=temperature,
+        stepsize=stepsize,
+        seed=seed,
+    )
     a, b, c, d, g = params
-    predictions = [(x, five_parameter_logistic(x, a, b, c, d, g)) for x in x_list]
-    r2 = _r_squared(y_list, [p for _, p in predictions])
+    r2 = _r_squared(y_arr, predicted)
     return FitResult(
         model="5PL",
         parameters={"a": a, "b": b, "c": c, "d": d, "g": g},
         r_squared=r2,
-        predictions=predictions,
+        xs=x_arr,
+        ys=predicted,
         converged=converged,
         status=status,
     )
 
 
+def _limit_worker_threads() -> None:
+    """Pin BLAS/OpenMP pools to one thread so parallel starts do not oversubscribe cores."""
+    # The pools are already loaded in the worker, so environment variables would come too late.
+    threadpool_limits(limits=1)
+
+
+def _fit_once(p0: List[float], *, fitter: Callable[..., FitResult], xs: List[float], ys: List[float]) -> FitResult:
+    return fitter(xs, ys, p0=p0)
+
+
+def _multistart(
+    fitter: Callable[..., FitResult],
+    x_list: List[float],
+    y_list: List[float],
+    p0: List[float],
+    lower: Sequence[float],
+    n_starts: int,
+    processes: Optional[int],
+    seed: Optional[int],
+    spread: float,
+) -> FitResult:
+    if n_starts < 1:
+        raise ValueError("n_starts must be at least 1")
+    rng = np.random.default_rng(seed)
+    base = np.asarray(p0, dtype=np.float64)
+    starts = [base.tolist()]
+    for _ in range(n_starts - 1):
+        perturbed = base * (1.0 + rng.normal(0.0, spread, size=base.size))
+        starts.append(np.maximum(perturbed, lower).tolist())
+    with Pool(processes, initializer=_limit_worker_threads) as pool:
+        results = pool.map(partial(_fit_once, fitter=fitter, xs=x_list, ys=y_list), starts)
+    best = max(results, key=lambda r: (r.converged, r.r_squared))
+    best.status = f"{best.status} (best of {n_starts} starts)"
+    return best
+
+
+def fit_4pl_multistart(
+    xs: Iterable[float],
+    ys: Iterable[float],
+    *,
+    n_starts: int = 16,
+    processes: Optional[int] = None,
+    seed: Optional[int] = None,
+    spread: float = 0.15,
+) -> FitResult:
+    """Fit 4PL from ``n_starts`` perturbed initial guesses in a process pool and keep the best fit."""
+    x_list, y_list = _validate_inputs(xs, ys)
+    return _multistart(
+        fit_4pl,
+        x_list,
+        y_list,
+        _initial_guess(x_list, y_list),
+        _BOUNDS_4PL[0],
+        n_starts,
+        processes,
+        seed,
+        spread,
+    )
+
+
+def fit_5pl_multistart(
+    xs: Iterable[float],
+    ys: Iterable[float],
+    *,
+    n_starts: int = 16,
+    processes: Optional[int] = None,
+    seed: Optional[int] = None,
+    spread: float = 0.15,
+) -> FitResult:
+    """Fit 5PL from ``n_starts`` perturbed initial guesses in a process pool and keep the best fit."""
+    x_list, y_list = _validate_inputs(xs, ys)
+    return _multistart(
+        fit_5pl,
+        x_list,
+        y_list,
+        _initial_guess(x_list, y_list) + [1.0],
+        _BOUNDS_5PL[0],
+        n_starts,
+        processes,
+        seed,
+        spread,
+    )
+
+
+_CURVE_MODELS: Dict[str, Tuple[Callable[..., np.ndarray], Tuple[str, ...]]] = {
+    "4PL": (four_parameter_logistic, ("a", "b", "c", "d")),
+    "5PL": (five_parameter_logistic, ("a", "b", "c", "d", "g")),
+}
+
+
 def plot_curve(result: FitResult, points: int = 20) -> List[Tuple[float, float]]:
-    xs = [p[0] for p in result.predictions]
-    min_x, max_x = min(xs), max(xs)
+    min_x, max_x = float(result.xs.min()), float(result.xs.max())
     span = max_x - min_x if max_x != min_x else 1.0
-    curve_points = []
-    for i in range(points):
-        x = min_x + span * i / (points - 1)
-        if result.model == "4PL":
-            params = result.parameters
-            y = four_parameter_logistic(x, params["a"], params["b"], params["c"], params["d"])
-        else:
-            params = result.parameters
-            y = five_parameter_logistic(
-                x, params["a"], params["b"], params["c"], params["d"], params["g"]
-            )
-        curve_points.append((x, y))
-    return curve_points
+    model, names = _CURVE_MODELS[result.model]
+    params = [result.parameters[name] for name in names]
+    curve_xs = np.linspace(min_x, min_x + span, points)
+    curve_ys = model(curve_xs, *params)
+    return list(zip(curve_xs.tolist(), curve_ys.tolist()))
@@ -1,6 +1,12 @@
 """Mock liquid handler interface for tests."""
+from collections import defaultdict
 from dataclasses import dataclass, field
-from typing import Dict, List
+from typing import DefaultDict, Dict, List, Optional, Tuple
+
+OP_LOAD = 0
+OP_TRANSFER = 1
+
+AuditEvent = Tuple[int, str, Optional[str], float]
 
 
 @dataclass
@@ -12,22 +18,30 @@ class Transfer:
 
 @dataclass
 class MockLiquidHandler:
-    audit_log: List[str] = field(default_factory=list)
-    deck_state: Dict[str, float] = field(default_factory=dict)
+    audit_log: List[AuditEvent] = field(default_factory=list)
+    deck_state: DefaultDict[str, float] = field(default_factory=lambda: defaultdict(float))
 
     def load_well(self, well: str, volume_ul: float) -> None:
-        self.deck_state[well] = self.deck_state.get(well, 0.0) + volume_ul
-        self.audit_log.append(f"load:{well}:{volume_ul}")
+        self.deck_state[well] += volume_ul
+        self.audit_log.append((OP_LOAD, well, None, volume_ul))
 
     def transfer(self, transfer: Transfer) -> None:
+        # Read the source without defaultdict insertion so a failed transfer leaves the deck untouched.
         available = self.deck_state.get(transfer.source, 0.0)
         if available < transfer.volume_ul:
             raise ValueError("Insufficient volume")
         self.deck_state[transfer.source] = available - transfer.volume_ul
-        self.deck_state[transfer.destination] = self.deck_state.get(transfer.destination, 0.0) + transfer.volume_ul
-        self.audit_log.append(
-            f"transfer:{transfer.source}->{transfer.destination}:{transfer.volume_ul}"
-        )
+        self.deck_state[transfer.destination] += transfer.volume_ul
+        self.audit_log.append((OP_TRANSFER, transfer.source, transfer.destination, transfer.volume_ul))
+
+    def formatted_audit(self) -> List[str]:
+        entries = []
+        for op, source, destination, volume_ul in self.audit_log:
+            if op == OP_TRANSFER:
+                entries.append(f"transfer:{source}->{destination}:{volume_ul}")
+            else:
+                entries.append(f"load:{source}:{volume_ul}")
+        return entries
 
     def summary(self) -> Dict[str, float]:
         return dict(self.deck_state)
@@ -1,7 +1,11 @@
 """Parsers for plate reader exports."""
 import csv
+from array import array
 from dataclasses import dataclass
-from typing import Dict, List
+from functools import cached_property
+from typing import Dict, List, Optional
+
+import numpy as np
 
 
 @dataclass
@@ -12,28 +16,60 @@ class WellReading:
 
 @dataclass
 class PlateRun:
+    """Plate readings stored column-wise: well labels plus a float64 value array."""
+
     instrument: str
     assay: str
-    readings: List[WellReading]
+    wells: List[str]
+    values: np.ndarray
+
+    @cached_property
+    def readings(self) -> List[WellReading]:
+        return [WellReading(well=well, value=value) for well, value in zip(self.wells, self.values.tolist())]
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, PlateRun):
+            return NotImplemented
+        return (
+            (self.instrument, self.assay, self.wells) == (other.instrument, other.assay, other.wells)
+            and np.array_equal(self.values, other.values)
+        )
 
     def to_json(self) -> Dict[str, object]:
         return {
             "instrument": self.instrument,
             "assay": self.assay,
             "readings": [
-                {"well": reading.well, "value": reading.value} for reading in self.readings
+                {"well": well, "value": value} for well, value in zip(self.wells, self.values.tolist())
             ],
         }
 
 
+def _column_index(header: List[str], name: str) -> Optional[int]:
+    for candidate in (name, name.lower()):
+        if candidate in header:
+            return header.index(candidate)
+    return None
+
+
 def parse_plate_csv(path: str, instrument: str, assay: str) -> PlateRun:
-    readings: List[WellReading] = []
+    wells: List[str] = []
+    values = array("d")
     with open(path, newline="", encoding="utf-8") as handle:
-        reader = csv.DictReader(handle)
-        for row in reader:
-            well = row.get("Well") or row.get("well")
-            value_str = row.get("Value") or row.get("value")
-            if not well or value_str is None:
-                continue
-            readings.append(WellReading(well=well.strip(), value=float(value_str)))
-    return PlateRun(instrument=instrument, assay=assay, readings=readings)
+        reader = csv.reader(handle)
+        header = next(reader, [])
+        well_idx = _column_index(header, "Well")
+        value_idx = _column_index(header, "Value")
+        if well_idx is not None and value_idx is not None:
+            width = max(well_idx, value_idx) + 1
+            for row in reader:
+                if len(row) < width or not row[well_idx] or not row[value_idx].strip():
+                    continue
+                wells.append(row[well_idx].strip())
+                values.append(float(row[value_idx]))
+    return PlateRun(
+        instrument=instrument,
+        assay=assay,
+        wells=wells,
+        values=np.frombuffer(values, dtype=np.float64),
+    )
@@ -1,11 +1,29 @@
+import copy
+import io
+import itertools
 import os
-from datetime import datetime
-from typing import Dict, List, Tuple
-
-from flask import Flask, flash, redirect, render_template, request, session, url_for
+import tempfile
+import time
+from collections import deque
+from functools import lru_cache
+from datetime import datetime, timedelta, timezone
+from typing import Deque, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+from cachelib import FileSystemCache
+from flask import Flask, flash, g, redirect, render_template, request, session, url_for
+from flask_session import Session
+from streaming_form_data import StreamingFormDataParser
+from streaming_form_data.targets import FileTarget, ValueTarget
 from werkzeug.utils import secure_filename
 
-from lims.adapter import AuthenticationError, LIMSAdapter
+try:
+    import pyarrow
+    from pyarrow import csv as pyarrow_csv
+except ImportError:  # pragma: no cover - pyarrow is an optional accelerator
+    pyarrow = None
+
+from lims.adapter import TOKEN_TTL_SECONDS, AuthenticationError, LIMSAdapter
 from lims.config import CFRPart11Policy, LIMSConfig, LIMSContext
 from orchestrator.workflow import build_full_run
 from qc.westgard import ControlResult
@@ -13,6 +31,15 @@ from qc.westgard import ControlResult
 app = Flask(__name__)
 app.secret_key = os.environ.get("FRONTEND_SECRET_KEY", "dev-secret-key")
 app.config["UPLOAD_FOLDER"] = os.path.join(os.path.dirname(__file__), "uploads")
+# Wizard state lives server-side; the cookie only carries the session id.
+# Sessions expire with their LIMS token; no count threshold, so active sessions are never evicted.
+app.config["PERMANENT_SESSION_LIFETIME"] = timedelta(seconds=TOKEN_TTL_SECONDS)
+app.config["SESSION_TYPE"] = "cachelib"
+app.config["SESSION_CACHELIB"] = FileSystemCache(
+    os.environ.get("FRONTEND_SESSION_DIR", os.path.join(os.path.dirname(__file__), "flask_session")),
+    threshold=0,
+)
+Session(app)
 
 ASSAY_OPTIONS = ["IRT", "hTSH", "17-OHP", "TGal", "CPK-MM"]
 
@@ -32,46 +59,113 @@ ACTION_ROLES = {
     "create_sample": {"technician", "admin"},
     "approve_record": {"qa", "admin"},
 }
+DEFAULT_ACTION_ROLES = frozenset(lim_config.allowed_roles)
 
 
-operator_journal: List[str] = []
+OPERATOR_JOURNAL_LIMIT = 10_000
+operator_journal: Deque[Tuple[int, str, str]] = deque(maxlen=OPERATOR_JOURNAL_LIMIT)
 
 
 def record_action(actor: str, action: str) -> None:
-    timestamp = datetime.utcnow().isoformat()
-    entry = f"{timestamp}Z - {actor}: {action}"
-    operator_journal.append(entry)
+    operator_journal.append((time.time_ns(), actor, action))
+
+
+def format_journal() -> Iterator[str]:
+    # Copy first: other request threads may append while the caller is still iterating.
+    for timestamp_ns, actor, action in tuple(operator_journal):
+        yield f"{datetime.fromtimestamp(timestamp_ns / 1e9, tz=timezone.utc).isoformat()} - {actor}: {action}"
+
+
+secure_filename_cached = lru_cache(maxsize=512)(secure_filename)
+
+
+@lru_cache(maxsize=512)
+def upload_path(upload_folder: str, filename: str) -> str:
+    return os.path.join(upload_folder, filename)
 
 
 def ensure_upload_folder() -> None:
     os.makedirs(app.config["UPLOAD_FOLDER"], exist_ok=True)
 
 
+@app.before_request
+def cache_auth() -> None:
+    g.auth = session.get("auth", {})
+
+
+UPLOAD_CHUNK_SIZE = 64 * 1024
+
+
+def stream_plate_upload(upload_folder: str) -> Tuple[Optional[str], Optional[str]]:
+    """Stream a multipart plate upload straight to disk.
+
+    Returns the sanitized stored filename (``None`` when no file was sent) and the
+    ``uploader`` form value.
+    """
+    fd, partial_path = tempfile.mkstemp(dir=upload_folder, suffix=".part")
+    os.close(fd)
+    file_target = FileTarget(partial_path)
+    uploader_target = ValueTarget()
+    parser = StreamingFormDataParser(headers=request.headers)
+    parser.register("plate_csv", file_target)
+    parser.register("uploader", uploader_target)
+    filename = None
+    try:
+        while chunk := request.stream.read(UPLOAD_CHUNK_SIZE):
+            parser.data_received(chunk)
+        filename = secure_filename_cached(file_target.multipart_filename or "") or None
+        if filename:
+            os.replace(partial_path, upload_path(upload_folder, filename))
+    finally:
+        if not filename and os.path.exists(partial_path):
+            os.remove(partial_path)
+    uploader = uploader_target.value.decode("utf-8") or None
+    return filename, uploader
+
+
+def save_form_upload(upload_folder: str) -> Tuple[Optional[str], Optional[str]]:
+    """Werkzeug form parsing for submissions that are not multipart streams."""
+    file = request.files.get("plate_csv")
+    uploader = request.form.get("uploader") or None
+    if not file or file.filename == "":
+        return None, uploader
+    filename = secure_filename_cached(file.filename)
+    file.save(upload_path(upload_folder, filename))
+    return filename, uploader
+
+
 def current_user() -> Dict[str, str]:
-    return session.get("auth", {})
+    return g.auth
 
 
 def require_login():
-    if not session.get("auth"):
+    if not current_user():
         flash("Войдите в систему для продолжения")
         return redirect(url_for("login"))
     return None
 
 
+def expire_login(exc: AuthenticationError):
+    session.pop("auth", None)
+    flash(str(exc))
+    return redirect(url_for("login"))
+
+
 def role_allowed(action: str) -> bool:
     role = current_user().get("role")
-    allowed = ACTION_ROLES.get(action, set(lim_config.allowed_roles))
+    allowed = ACTION_ROLES.get(action, DEFAULT_ACTION_ROLES)
     return bool(role and role in allowed)
 
 
 def get_audit_entries() -> List[Dict[str, str]]:
     entries = []
-    for entry in adapter.get_audit_trail():
+    # Requests are served on several threads, so render from an isolated copy.
+    for entry in adapter.snapshot():
         entries.append(
             {
                 "user": entry.user_id,
                 "action": entry.action,
-                "timestamp": entry.timestamp.isoformat(),
+                "timestamp": entry.iso,
                 "signature": entry.signature,
                 "reason": entry.reason,
             }
@@ -79,12 +173,88 @@ def get_audit_entries() -> List[Dict[str, str]]:
     return entries
 
 
+@lru_cache(maxsize=32)
+def _run_pipeline_cached(
+    plate_path: str,
+    plate_mtime_ns: int,
+    instrument: str,
+    assay: str,
+    standards: Tuple[Tuple[float, float], ...],
+    controls: Tuple[Tuple[int, float, float, float], ...],
+) -> Tuple[Dict[str, object], Tuple[str, ...]]:
+    controls_objects = [
+        ControlResult(run=run, value=value, mean=mean, sd=sd) for run, value, mean, sd in controls
+    ]
+    dag, run_logger = build_full_run(
+        plate_path=plate_path,
+        instrument=instrument,
+        assay=assay,
+        standards=list(standards),
+        controls=controls_objects,
+    )
+    return dict(dag.run()), tuple(run_logger.entries)
+
+
+def run_pipeline(wizard: Dict[str, object]) -> Tuple[Dict[str, object], List[str]]:
+    """Run the orchestrated DAG, reusing results while the plate file and inputs are unchanged."""
+    plate_path = wizard["plate_path"]
+    result_map, run_entries = _run_pipeline_cached(
+        plate_path,
+        os.stat(plate_path).st_mtime_ns,
+        wizard.get("instrument", ""),
+        wizard.get("assay", ""),
+        tuple((conc, signal) for conc, signal in wizard.get("standards", [])),
+        tuple((ctrl["run"], ctrl["value"], ctrl["mean"], ctrl["sd"]) for ctrl in wizard.get("controls", [])),
+    )
+    return copy.deepcopy(result_map), list(run_entries)
+
+
 @app.context_processor
 def inject_globals() -> Dict[str, object]:
     return {"current_user": current_user(), "lim_config": lim_config, "lim_policy": lim_policy}
 
 
+# Pastes shorter than this parse faster with NumPy than with pyarrow's reader setup.
+PYARROW_MIN_LINES = 32
+
+
+def load_rows_pyarrow(raw: str, columns: int) -> Optional[np.ndarray]:
+    names = [f"c{i}" for i in range(columns)]
+    try:
+        table = pyarrow_csv.read_csv(
+            io.BytesIO(raw.encode("utf-8")),
+            read_options=pyarrow_csv.ReadOptions(column_names=names),
+            # Same syntax as the NumPy and per-line parsers, which treat quotes as invalid.
+            parse_options=pyarrow_csv.ParseOptions(quote_char=False),
+            convert_options=pyarrow_csv.ConvertOptions(column_types={name: pyarrow.float64() for name in names}),
+        )
+    except pyarrow.ArrowInvalid:
+        return None
+    if any(column.null_count for column in table.columns):
+        return None
+    return np.column_stack([column.to_numpy() for column in table.columns])
+
+
+def load_numeric_rows(raw: str, columns: int) -> Optional[np.ndarray]:
+    """Parse comma-separated numeric rows in one vectorized pass; ``None`` when the text is malformed."""
+    if not raw.strip():
+        return np.empty((0, columns))
+    if pyarrow is not None and raw.count("\n") >= PYARROW_MIN_LINES:
+        rows = load_rows_pyarrow(raw, columns)
+        if rows is not None:
+            return rows
+    try:
+        rows = np.loadtxt(io.StringIO(raw), delimiter=",", comments=None, ndmin=2)
+    except ValueError:
+        return None
+    return rows if rows.shape[1] == columns else None
+
+
 def parse_standards(raw: str) -> List[Tuple[float, float]]:
+    rows = load_numeric_rows(raw, columns=2)
+    if rows is not None:
+        return [(conc, signal) for conc, signal in rows.tolist()]
+    # Malformed input: re-parse line by line to report the offending entry.
     standards: List[Tuple[float, float]] = []
     for line in raw.splitlines():
         line = line.strip()
@@ -99,6 +269,12 @@ def parse_standards(raw: str) -> List[Tuple[float, float]]:
 
 
 def parse_controls(raw: str) -> List[Dict[str, float]]:
+    rows = load_numeric_rows(raw, columns=4)
+    if rows is not None:
+        return [
+            {"run": int(run_id), "value": value, "mean": mean, "sd": sd}
+            for run_id, value, mean, sd in rows.tolist()
+        ]
     controls: List[Dict[str, float]] = []
     for line in raw.splitlines():
         line = line.strip()
@@ -135,7 +311,9 @@ def login():
 
 @app.route("/logout")
 def logout():
-    session.pop("auth", None)
+    auth = session.pop("auth", None)
+    if auth:
+        adapter.revoke_token(auth.get("token", ""))
     session.pop("wizard", None)
     flash("Вы вышли из системы")
     return redirect(url_for("login"))
@@ -173,14 +351,16 @@ def upload_csv():
         return redirect(url_for("select_test"))
     if request.method == "POST":
         ensure_upload_folder()
-        file = request.files.get("plate_csv")
-        operator = request.form.get("uploader") or wizard.get("operator", "unknown")
-        if not file or file.filename == "":
+        upload_folder = app.config["UPLOAD_FOLDER"]
+        if request.mimetype == "multipart/form-data":
+            filename, uploader = stream_plate_upload(upload_folder)
+        else:
+            filename, uploader = save_form_upload(upload_folder)
+        operator = uploader or wizard.get("operator", "unknown")
+        if not filename:
             flash("Загрузите CSV файл с показаниями")
             return redirect(url_for("upload_csv"))
-        filename = secure_filename(file.filename)
-        filepath = os.path.join(app.config["UPLOAD_FOLDER"], filename)
-        file.save(filepath)
+        filepath = upload_path(upload_folder, filename)
         wizard.update({"plate_path": filepath, "uploaded_by": operator})
         session["wizard"] = wizard
         record_action(operator, f"загрузил CSV {filename}")
@@ -222,14 +402,17 @@ def standards():
                 flash("Недостаточно прав для создания записи образца")
                 return redirect(url_for("standards"))
             token = current_user().get("token", "")
-            sample_id = adapter.create_sample(
-                token,
-                {
-                    "assay": wizard.get("assay", ""),
-                    "instrument": wizard.get("instrument", ""),
-                    "operator": wizard.get("operator", ""),
-                },
-            )
+            try:
+                sample_id = adapter.create_sample(
+                    token,
+                    {
+                        "assay": wizard.get("assay", ""),
+                        "instrument": wizard.get("instrument", ""),
+                        "operator": wizard.get("operator", ""),
+                    },
+                )
+            except AuthenticationError as exc:
+                return expire_login(exc)
             wizard["sample_id"] = sample_id
             session["wizard"] = wizard
             flash(f"Создана запись образца {sample_id}")
@@ -252,22 +435,10 @@ def review():
     if not wizard.get("standards"):
         flash("Введите стандарты перед просмотром результатов")
         return redirect(url_for("standards"))
-    controls_objects = [
-        ControlResult(run=ctrl["run"], value=ctrl["value"], mean=ctrl["mean"], sd=ctrl["sd"])
-        for ctrl in wizard.get("controls", [])
-    ]
-    dag, run_logger = build_full_run(
-        plate_path=wizard["plate_path"],
-        instrument=wizard.get("instrument", ""),
-        assay=wizard.get("assay", ""),
-        standards=wizard.get("standards", []),
-        controls=controls_objects,
-    )
-    dag_results = dag.run()
-    result_map = {name: result for name, result in dag_results}
+    result_map, run_entries = run_pipeline(wizard)
     analytics_result = result_map.get("analytics", {})
     westgard = result_map.get("qc", {})
-    audit_entries = operator_journal + run_logger.entries
+    audit_entries = list(itertools.chain(format_journal(), run_entries))
     audit_log = get_audit_entries()
     approval = wizard.get("approved_by")
     can_approve = role_allowed("approve_record")
@@ -299,7 +470,10 @@ def approve():
         return redirect(url_for("review"))
     token = current_user().get("token", "")
     record_id = wizard.get("sample_id") or "result"
-    adapter.approve_record(token, record_id, reason=reason)
+    try:
+        adapter.approve_record(token, record_id, reason=reason)
+    except AuthenticationError as exc:
+        return expire_login(exc)
     wizard["approved_by"] = approver
     wizard["approval_reason"] = reason
     session["wizard"] = wizard
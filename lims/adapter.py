@@ -1,9 +1,12 @@
 """Adapter stubs for connecting to common LIMS/ELN platforms."""
-from datetime import datetime
-from typing import Dict, List, Optional
+import time
+from typing import Dict, Optional, Sequence, Tuple
 
 from .config import AuditTrailEntry, CFRPart11Policy, LIMSConfig, LIMSContext
 
+# Session tokens expire after one working shift.
+TOKEN_TTL_SECONDS = 8 * 3600
+
 
 class AuthenticationError(Exception):
     """Raised when authentication fails."""
@@ -16,12 +19,16 @@ class AuthorizationError(Exception):
 class LIMSAdapter:
     """Stub implementation simulating calls into a LIMS/ELN instance."""
 
-    def __init__(self, context: LIMSContext):
+    def __init__(self, context: LIMSContext, token_ttl_seconds: float = TOKEN_TTL_SECONDS):
         self.context = context
+        self.token_ttl_seconds = token_ttl_seconds
         self._users: Dict[str, Dict[str, str]] = {}
+        # token -> (user_id, monotonic expiry); insertion order is expiry order.
+        self._tokens: Dict[str, Tuple[str, float]] = {}
+        self._allowed_roles = frozenset(context.config.allowed_roles)
 
     def register_user(self, user_id: str, role: str, password: str) -> None:
-        if role not in self.context.config.allowed_roles:
+        if role not in self._allowed_roles:
             raise AuthorizationError(f"Role {role} is not permitted")
         self._users[user_id] = {"role": role, "password": password}
 
@@ -31,7 +38,10 @@ class LIMSAdapter:
             raise AuthenticationError("Invalid credentials")
         if self.context.config.enforce_multi_factor and otp is None:
             raise AuthenticationError("Missing one-time passcode")
-        token = f"token-{user_id}-{datetime.utcnow().timestamp()}"
+        now = time.monotonic()
+        self._purge_expired_tokens(now)
+        token = f"token-{user_id}-{now}"
+        self._tokens[token] = (user_id, now + self.token_ttl_seconds)
         self._record_action(user_id, "login", signature=token)
         return token
 
@@ -39,34 +49,63 @@ class LIMSAdapter:
         entry = AuditTrailEntry(
             user_id=user_id,
             action=action,
-            timestamp=datetime.utcnow(),
+            timestamp=time.time_ns(),
             signature=signature or f"sig-{user_id}",
             reason=reason if self.context.policy.require_reason_for_changes else None,
         )
         self.context.record(entry)
 
     def create_sample(self, token: str, sample_meta: Dict[str, str]) -> str:
-        self._assert_token(token)
-        user_id = token.split("-")[1]
-        sample_id = f"S-{len(self.context.audit_trail):04d}"
+        user_id = self._assert_token(token)
+        sample_id = f"S-{self.context.next_sample_number():04d}"
         self._record_action(user_id, f"create_sample:{sample_id}", signature=token)
         return sample_id
 
     def approve_record(self, token: str, record_id: str, reason: Optional[str] = None) -> None:
-        self._assert_token(token)
-        user_id = token.split("-")[1]
+        user_id = self._assert_token(token)
         self._record_action(user_id, f"approve:{record_id}", reason=reason, signature=token)
+        # Approval closes a workflow; make its entries visible on the trail right away.
+        self.context.flush()
 
     def get_role(self, user_id: str) -> Optional[str]:
         user = self._users.get(user_id)
         return user.get("role") if user else None
 
-    def _assert_token(self, token: str) -> None:
-        if not token.startswith("token-"):
-            raise AuthenticationError("Invalid token format")
-
-    def get_audit_trail(self) -> List[AuditTrailEntry]:
-        return list(self.context.audit_trail)
+    def revoke_token(self, token: str) -> None:
+        """Invalidate a session token, e.g. on logout; unknown tokens are ignored."""
+        user_id, _ = self._tokens.pop(token, (None, 0.0))
+        if user_id is not None:
+            self._record_action(user_id, "logout", signature=token)
+
+    def _purge_expired_tokens(self, now: float) -> None:
+        while self._tokens:
+            token, (_, expires_at) = next(iter(self._tokens.items()))
+            if expires_at > now:
+                break
+            del self._tokens[token]
+
+    def _assert_token(self, token: str) -> str:
+        user_id, expires_at = self._tokens.get(token, (None, 0.0))
+        if user_id is None or expires_at <= time.monotonic():
+            self._tokens.pop(token, None)
+            raise AuthenticationError("Unknown or expired token")
+        return user_id
+
+    def get_audit_trail(self, *, copy: bool = False) -> Sequence[AuditTrailEntry]:
+        """Return the live audit trail for read-only use, or an isolated copy with ``copy=True``.
+
+        The live deque must not be iterated while other threads may record entries; use
+        ``snapshot()`` there.
+        """
+        self.context.flush()
+        if copy:
+            return self.snapshot()
+        return self.context.audit_trail
+
+    def snapshot(self) -> Tuple[AuditTrailEntry, ...]:
+        """Return an immutable copy of the audit trail as of this call."""
+        self.context.flush()
+        return tuple(self.context.audit_trail)
 
 
 __all__ = [
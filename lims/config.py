@@ -1,19 +1,32 @@
 """Configuration models for integrating with external LIMS/ELN systems."""
+import threading
+import time
+from collections import deque
 from dataclasses import dataclass, field
-from datetime import datetime
-from typing import List, Optional
+from datetime import datetime, timezone
+from typing import Deque, List, Optional, Tuple
 
+_NS_PER_DAY = 86_400 * 1_000_000_000
+_DEFAULT_ROLES: Tuple[str, ...] = ("technician", "qa", "admin")
+# Audit entries are staged and moved to the trail in batches of this size.
+AUDIT_FLUSH_BATCH = 64
 
-@dataclass
+
+@dataclass(slots=True)
 class AuditTrailEntry:
     """Minimal audit entry capturing 21 CFR Part 11 attributes."""
 
     user_id: str
     action: str
-    timestamp: datetime
+    timestamp: int  # nanoseconds since the Unix epoch
     signature: str
     reason: Optional[str] = None
 
+    @property
+    def iso(self) -> str:
+        """Render the timestamp as an ISO 8601 UTC string on demand."""
+        return datetime.fromtimestamp(self.timestamp / 1e9, tz=timezone.utc).isoformat()
+
 
 @dataclass
 class LIMSConfig:
@@ -23,7 +36,7 @@ class LIMSConfig:
     base_url: str
     api_key: str
     enforce_multi_factor: bool = True
-    allowed_roles: List[str] = field(default_factory=lambda: ["technician", "qa", "admin"])
+    allowed_roles: Tuple[str, ...] = _DEFAULT_ROLES
 
 
 @dataclass
@@ -36,14 +49,61 @@ class CFRPart11Policy:
     audit_retention_days: int = 365 * 5
 
 
-@dataclass
+@dataclass(slots=True)
 class LIMSContext:
     """Bundle of configuration and audit trail entries for adapters."""
 
     config: LIMSConfig
     policy: CFRPart11Policy
-    audit_trail: List[AuditTrailEntry] = field(default_factory=list)
+    audit_trail: Deque[AuditTrailEntry] = field(default_factory=deque)
+    sample_counter: int = 0
+    _pending: List[AuditTrailEntry] = field(default_factory=list, repr=False, compare=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
 
     def record(self, entry: AuditTrailEntry) -> None:
-        """Append a new audit trail entry."""
-        self.audit_trail.append(entry)
+        """Stage a new audit trail entry; full batches are flushed to the trail."""
+        with self._lock:
+            self._pending.append(entry)
+            if len(self._pending) >= AUDIT_FLUSH_BATCH:
+                self._flush_locked()
+
+    def flush(self) -> None:
+        """Move staged entries onto the audit trail."""
+        with self._lock:
+            self._flush_locked()
+
+    def _flush_locked(self) -> None:
+        if self._pending:
+            self.audit_trail.extend(self._pending)
+            self._pending.clear()
+            # Only entries past the Part 11 retention window are ever dropped implicitly.
+            self._trim_locked(None)
+
+    def next_sample_number(self) -> int:
+        """Allocate the next sample number independently of the audit trail length."""
+        with self._lock:
+            self.sample_counter += 1
+            return self.sample_counter
+
+    def trim(self, max_entries: Optional[int] = None) -> int:
+        """Drop entries older than the retention window, then the oldest beyond ``max_entries``.
+
+        Flushing already applies the retention window; ``max_entries`` is an explicit opt-in cap
+        that may drop records still inside it. Returns the number of entries removed.
+        """
+        with self._lock:
+            before = len(self.audit_trail) + len(self._pending)
+            self._flush_locked()
+            self._trim_locked(max_entries)
+            return before - len(self.audit_trail)
+
+    def _trim_locked(self, max_entries: Optional[int]) -> int:
+        trail = self.audit_trail
+        before = len(trail)
+        cutoff = time.time_ns() - self.policy.audit_retention_days * _NS_PER_DAY
+        while trail and trail[0].timestamp < cutoff:
+            trail.popleft()
+        if max_entries is not None:
+            while len(trail) > max_entries:
+                trail.popleft()
+        return before - len(trail)
@@ -1,6 +1,8 @@
 """Workflow DAG chaining SOP execution, data ingestion, analytics, and QC."""
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from dataclasses import dataclass, field
-from typing import Callable, Dict, List, Tuple
+from functools import partial
+from typing import Callable, Dict, List, Optional, Sequence, Set, Tuple
 
 from connectors.plate_reader import parse_plate_csv
 from analytics.curve_fitting import fit_4pl, fit_5pl
@@ -16,10 +18,11 @@ class AuditLogger:
         self.entries.append(message)
 
 
-@dataclass
+@dataclass(slots=True)
 class WorkflowTask:
     name: str
     func: Callable[..., object]
+    depends_on: Tuple[str, ...] = ()
 
 
 class WorkflowDAG:
@@ -27,77 +30,134 @@ class WorkflowDAG:
         self.logger = logger
         self.tasks: List[WorkflowTask] = []
 
-    def add_task(self, name: str, func: Callable[..., object]) -> None:
-        self.tasks.append(WorkflowTask(name=name, func=func))
+    def add_task(self, name: str, func: Callable[..., object], depends_on: Optional[Sequence[str]] = None) -> None:
+        """Register a task; ``depends_on=None`` chains it after the previously added task."""
+        if depends_on is None:
+            depends_on = (self.tasks[-1].name,) if self.tasks else ()
+        self.tasks.append(WorkflowTask(name=name, func=func, depends_on=tuple(depends_on)))
+
+    def run(self, max_workers: Optional[int] = None) -> List[Tuple[str, object]]:
+        """Execute tasks on a thread pool as their dependencies complete.
 
-    def run(self) -> List[Tuple[str, object]]:
-        results: List[Tuple[str, object]] = []
+        Results are returned in declaration order; ``executed:`` audit entries are
+        logged in completion order.
+        """
+        tasks = {task.name: task for task in self.tasks}
         for task in self.tasks:
-            output = task.func()
-            results.append((task.name, output))
-            self.logger.log(f"executed:{task.name}")
-        return results
+            unknown = [dep for dep in task.depends_on if dep not in tasks]
+            if unknown:
+                raise ValueError(f"Task {task.name} depends on unknown tasks: {', '.join(unknown)}")
+
+        outputs: Dict[str, object] = {}
+        waiting: Dict[str, Set[str]] = {task.name: set(task.depends_on) for task in self.tasks}
+        running: Dict[Future, str] = {}
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            while waiting or running:
+                for name in [name for name, deps in waiting.items() if not deps]:
+                    del waiting[name]
+                    running[pool.submit(tasks[name].func)] = name
+                if not running:
+                    raise ValueError(f"Cyclic task dependencies: {', '.join(waiting)}")
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    outputs[name] = future.result()
+                    self.logger.log(f"executed:{name}")
+                    for deps in waiting.values():
+                        deps.discard(name)
+        return [(task.name, outputs[task.name]) for task in self.tasks]
+
+
+@dataclass(frozen=True)
+class _ElisaRun:
+    """Inputs shared by every task of one ELISA run."""
+
+    service: WorkflowService
+    plate_path: str
+    instrument: str
+    assay: str
+    standards: List[Tuple[float, float]]
+    controls: List[ControlResult]
+
+
+def _prepare_start(run: _ElisaRun) -> object:
+    return run.service.record_step_start(
+        "elisa", operator="operator-1", inputs={"operator": "operator-1", "reagent_lot": "lot-1"}
+    )
 
 
-def build_full_run(
-    plate_path: str, instrument: str, assay: str, standards: List[Tuple[float, float]], controls: List[ControlResult]
-) -> Tuple[WorkflowDAG, AuditLogger]:
-    logger = AuditLogger()
-    service = WorkflowService()
-    workflow = service.create_workflow_from_template("elisa", "elisa_basic")
+def _prepare_complete(run: _ElisaRun) -> object:
+    return run.service.record_step_signature(
+        "elisa", signature="sig-prepare", completion_inputs={"incubation_time_minutes": "30"}
+    )
 
-    dag = WorkflowDAG(logger)
 
-    dag.add_task(
-        "plate-preparation-start",
-        lambda: service.record_step_start(
-            "elisa", operator="operator-1", inputs={"operator": "operator-1", "reagent_lot": "lot-1"}
-        ),
-    )
-    dag.add_task(
-        "plate-preparation-complete",
-        lambda: service.record_step_signature(
-            "elisa", signature="sig-prepare", completion_inputs={"incubation_time_minutes": "30"}
-        ),
-    )
+def _ingest(run: _ElisaRun) -> object:
+    return parse_plate_csv(run.plate_path, instrument=run.instrument, assay=run.assay).to_json()
 
-    dag.add_task(
-        "ingest",
-        lambda: parse_plate_csv(plate_path, instrument=instrument, assay=assay).to_json(),
-    )
 
-    dag.add_task(
-        "plate-reading-start",
-        lambda: service.record_step_start(
-            "elisa", operator="operator-2", inputs={"operator": "operator-2", "instrument": instrument}
-        ),
+def _reading_start(run: _ElisaRun) -> object:
+    return run.service.record_step_start(
+        "elisa", operator="operator-2", inputs={"operator": "operator-2", "instrument": run.instrument}
     )
-    dag.add_task(
-        "plate-reading-complete",
-        lambda: service.record_step_signature(
-            "elisa", signature="sig-read", completion_inputs={"runtime_minutes": "6"}
-        ),
+
+
+def _reading_complete(run: _ElisaRun) -> object:
+    return run.service.record_step_signature(
+        "elisa", signature="sig-read", completion_inputs={"runtime_minutes": "6"}
     )
 
-    def _fit():
-        xs, ys = zip(*standards)
-        fit = fit_4pl(xs, ys)
-        return {"fit": fit, "curve": fit_5pl(xs, ys)}
 
-    dag.add_task("analytics", _fit)
+def _fit(run: _ElisaRun) -> object:
+    xs, ys = zip(*run.standards)
+    fit = fit_4pl(xs, ys)
+    # Warm-start 5PL from the 4PL optimum (g = 1 reduces 5PL to 4PL).
+    p0 = [fit.parameters[name] for name in ("a", "b", "c", "d")] + [1.0] if fit.converged else None
+    return {"fit": fit, "curve": fit_5pl(xs, ys, p0=p0)}
+
 
-    dag.add_task(
-        "analysis-and-qc-start",
-        lambda: service.record_step_start(
-            "elisa", operator="analyst-1", inputs={"analyst": "analyst-1"}
-        ),
+def _analysis_start(run: _ElisaRun) -> object:
+    return run.service.record_step_start("elisa", operator="analyst-1", inputs={"analyst": "analyst-1"})
+
+
+def _qc(run: _ElisaRun) -> object:
+    return check_westgard(run.controls)
+
+
+def _analysis_complete(run: _ElisaRun) -> object:
+    return run.service.record_step_signature(
+        "elisa", signature="sig-qc", completion_inputs={"qc_rule": "westgard", "report_path": "/tmp/report"}
     )
-    dag.add_task("qc", lambda: check_westgard(controls))
 
-    dag.add_task(
+
+# SOP steps stay strictly ordered; ingest, analytics and QC only need their inputs
+# and run concurrently with them, and the final sign-off waits for all results.
+_ELISA_TASKS: Tuple[Tuple[str, Callable[[_ElisaRun], object], Tuple[str, ...]], ...] = (
+    ("plate-preparation-start", _prepare_start, ()),
+    ("plate-preparation-complete", _prepare_complete, ("plate-preparation-start",)),
+    ("ingest", _ingest, ()),
+    ("plate-reading-start", _reading_start, ("plate-preparation-complete",)),
+    ("plate-reading-complete", _reading_complete, ("plate-reading-start",)),
+    ("analytics", _fit, ()),
+    ("analysis-and-qc-start", _analysis_start, ("plate-reading-complete",)),
+    ("qc", _qc, ()),
+    (
         "analysis-and-qc-complete",
-        lambda: service.record_step_signature(
-            "elisa", signature="sig-qc", completion_inputs={"qc_rule": "westgard", "report_path": "/tmp/report"}
-        ),
-    )
+        _analysis_complete,
+        ("analysis-and-qc-start", "ingest", "analytics", "qc"),
+    ),
+)
+
+
+def build_full_run(
+    plate_path: str, instrument: str, assay: str, standards: List[Tuple[float, float]], controls: List[ControlResult]
+) -> Tuple[WorkflowDAG, AuditLogger]:
+    logger = AuditLogger()
+    service = WorkflowService()
+    service.create_workflow_from_template("elisa", "elisa_basic")
+    run = _ElisaRun(service, plate_path, instrument, assay, standards, controls)
+
+    dag = WorkflowDAG(logger)
+    for name, func, depends_on in _ELISA_TASKS:
+        dag.add_task(name, partial(func, run), depends_on=depends_on)
     return dag, logger
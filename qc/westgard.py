@@ -1,18 +1,30 @@
 """Quality control helpers: Westgard rules and Levey–Jennings charting."""
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Dict, List, Tuple
 
+import numpy as np
 
-@dataclass
+try:
+    import numba
+except ImportError:  # pragma: no cover - numba is an optional accelerator
+    numba = None
+
+# Below this many control points the scalar loop beats NumPy's per-call setup cost.
+VECTORIZE_THRESHOLD = 64
+
+RULES = ("1_2s", "1_3s", "2_2s", "r_4s", "4_1s", "10_x")
+
+
+@dataclass(frozen=True, slots=True)
 class ControlResult:
     run: int
     value: float
     mean: float
     sd: float
+    z_score: float = field(init=False)
 
-    @property
-    def z_score(self) -> float:
-        return (self.value - self.mean) / self.sd if self.sd else 0.0
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "z_score", (self.value - self.mean) / self.sd if self.sd else 0.0)
 
 
 def check_westgard(results: List[ControlResult]) -> Dict[str, List[int]]:
@@ -31,28 +43,118 @@ def check_westgard(results: List[ControlResult]) -> Dict[str, List[int]]:
     - ``10_x``: ten consecutive controls fall on the same side of the mean.
     """
 
+    if len(results) > VECTORIZE_THRESHOLD:
+        if _westgard_kernel_jit is not None:
+            indices, counts = _westgard_kernel_jit(_z_scores(results))
+            return {rule: indices[i, : counts[i]].tolist() for i, rule in enumerate(RULES)}
+        return _check_westgard_vectorized(results)
+    return _check_westgard_scalar(results)
+
+
+def _check_westgard_scalar(results: List[ControlResult]) -> Dict[str, List[int]]:
+    """Single pass with running counters for the 4_1s and 10_x streaks."""
     breaches: Dict[str, List[int]] = {"1_2s": [], "1_3s": [], "2_2s": [], "r_4s": [], "4_1s": [], "10_x": []}
-    z_scores = [r.z_score for r in results]
+    previous = 0.0
+    run_ge_1sd = run_positive = run_negative = 0
 
-    for idx, z in enumerate(z_scores):
-        if abs(z) >= 2:
+    for idx, result in enumerate(results):
+        z = result.z_score
+        abs_z = abs(z)
+        if abs_z >= 2:
             breaches["1_2s"].append(idx)
-        if abs(z) >= 3:
+        if abs_z >= 3:
             breaches["1_3s"].append(idx)
         if idx >= 1:
-            separation = abs(z - z_scores[idx - 1])
-            if separation >= 4 and z * z_scores[idx - 1] < 0:
+            if abs(z - previous) >= 4 and z * previous < 0:
                 breaches["r_4s"].append(idx)
-        if idx >= 1 and abs(z) >= 2 and abs(z_scores[idx - 1]) >= 2:
-            breaches["2_2s"].append(idx)
-        if idx >= 3 and all(abs(z_scores[j]) >= 1 for j in range(idx - 3, idx + 1)):
+            if abs_z >= 2 and abs(previous) >= 2:
+                breaches["2_2s"].append(idx)
+        run_ge_1sd = run_ge_1sd + 1 if abs_z >= 1 else 0
+        run_positive = run_positive + 1 if z > 0 else 0
+        run_negative = run_negative + 1 if z < 0 else 0
+        if run_ge_1sd >= 4:
             breaches["4_1s"].append(idx)
-        if idx >= 9:
-            window = z_scores[idx - 9 : idx + 1]
-            if all(score > 0 for score in window) or all(score < 0 for score in window):
-                breaches["10_x"].append(idx)
+        if run_positive >= 10 or run_negative >= 10:
+            breaches["10_x"].append(idx)
+        previous = z
     return breaches
 
 
+def _z_scores(results: List[ControlResult]) -> np.ndarray:
+    return np.fromiter((r.z_score for r in results), dtype=np.float64, count=len(results))
+
+
+def _check_westgard_vectorized(results: List[ControlResult]) -> Dict[str, List[int]]:
+    """Same rules as the scalar loop, expressed as boolean masks over the z-score array.
+
+    Streak rules avoid per-window work: ``10_x`` compares a cumulative sum of signs ten
+    points apart and ``4_1s`` convolves the ``|z| >= 1`` mask with a width-4 box.
+    """
+    z = _z_scores(results)
+    abs_z = np.abs(z)
+    ge_2sd = abs_z >= 2
+    opposite_sides = z[1:] * z[:-1] < 0
+    sign_sums = np.concatenate(([0], np.cumsum(np.sign(z).astype(np.int64))))
+    same_side_runs = np.abs(sign_sums[10:] - sign_sums[:-10]) == 10
+    ge_1sd_runs = np.zeros(0, dtype=bool)
+    if z.size >= 4:  # "valid" mode would swap operands for shorter inputs
+        ge_1sd_runs = np.convolve((abs_z >= 1).astype(np.int8), np.ones(4, dtype=np.int8), "valid") == 4
+    return {
+        "1_2s": np.flatnonzero(ge_2sd).tolist(),
+        "1_3s": np.flatnonzero(abs_z >= 3).tolist(),
+        "2_2s": (np.flatnonzero(ge_2sd[1:] & ge_2sd[:-1]) + 1).tolist(),
+        "r_4s": (np.flatnonzero(opposite_sides & (np.abs(np.diff(z)) >= 4)) + 1).tolist(),
+        "4_1s": (np.flatnonzero(ge_1sd_runs) + 3).tolist(),
+        "10_x": (np.flatnonzero(same_side_runs) + 9).tolist(),
+    }
+
+
+def _westgard_kernel(z: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Counter-based rule pass over a z-score array, written for Numba.
+
+    Row ``i`` of the returned index buffer holds the breaches of ``RULES[i]``;
+    only its first ``counts[i]`` entries are valid.
+    """
+    indices = np.empty((6, z.size), dtype=np.int64)
+    counts = np.zeros(6, dtype=np.int64)
+    previous = 0.0
+    run_ge_1sd = 0
+    run_positive = 0
+    run_negative = 0
+    for idx in range(z.size):
+        score = z[idx]
+        abs_z = abs(score)
+        if abs_z >= 2:
+            indices[0, counts[0]] = idx
+            counts[0] += 1
+        if abs_z >= 3:
+            indices[1, counts[1]] = idx
+            counts[1] += 1
+        if idx >= 1:
+            if abs_z >= 2 and abs(previous) >= 2:
+                indices[2, counts[2]] = idx
+                counts[2] += 1
+            if abs(score - previous) >= 4 and score * previous < 0:
+                indices[3, counts[3]] = idx
+                counts[3] += 1
+        run_ge_1sd = run_ge_1sd + 1 if abs_z >= 1 else 0
+        run_positive = run_positive + 1 if score > 0 else 0
+        run_negative = run_negative + 1 if score < 0 else 0
+        if run_ge_1sd >= 4:
+            indices[4, counts[4]] = idx
+            counts[4] += 1
+        if run_positive >= 10 or run_negative >= 10:
+            indices[5, counts[5]] = idx
+            counts[5] += 1
+        previous = score
+    return indices, counts
+
+
+if numba is not None:
+    _westgard_kernel_jit = numba.njit(cache=True, boundscheck=False, fastmath=True)(_westgard_kernel)
+else:  # pragma: no cover - depends on numba availability
+    _westgard_kernel_jit = None
+
+
 def levey_jennings_points(results: List[ControlResult]) -> List[Tuple[int, float, float]]:
     return [(r.run, r.value, r.z_score) for r in results]
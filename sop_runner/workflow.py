@@ -1,207 +1,336 @@
 """Lightweight SOP execution workflow service."""
+from __future__ import annotations
+
+import json
+import os
+import sys
+import tempfile
+import time
+from collections.abc import Mapping, Sequence
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta
+from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional
+from types import MappingProxyType
+from typing import ClassVar
 
 import yaml
 
+_NS_PER_SECOND = 1_000_000_000
 
-@dataclass
+# Templates shipped with the package; sidecars are never written next to them.
+_BUNDLED_TEMPLATE_DIR = Path(__file__).parent / "templates"
+
+# Preference order when a template exists under several extensions.
+_TEMPLATE_SUFFIXES = (".yaml", ".yml", ".json")
+
+# libyaml's C loader when PyYAML was built with it; same safe semantics either way.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def _seconds_to_ns(seconds: int | None) -> int | None:
+    return None if seconds is None else seconds * _NS_PER_SECOND
+
+
+@dataclass(slots=True)
 class StepTemplate:
     """Definition of a workflow step driven by a template file."""
 
     name: str
-    required_start_fields: List[str] = field(default_factory=list)
-    required_completion_fields: List[str] = field(default_factory=list)
-    min_duration_seconds: Optional[int] = None
-    max_duration_seconds: Optional[int] = None
-    controls: List[str] = field(default_factory=list)
-    reagents: List[Dict[str, str]] = field(default_factory=list)
+    required_start_fields: Sequence[str] = ()
+    required_completion_fields: Sequence[str] = ()
+    min_duration_seconds: int | None = None
+    max_duration_seconds: int | None = None
+    controls: Sequence[str] = ()
+    reagents: Sequence[Mapping[str, str]] = ()
+    _required_start_set: frozenset[str] = field(init=False, repr=False, compare=False)
+    _required_completion_set: frozenset[str] = field(init=False, repr=False, compare=False)
+    _min_duration_ns: int | None = field(init=False, repr=False, compare=False)
+    _max_duration_ns: int | None = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Templates are shared between workflows through the library cache; keep them read-only.
+        self.required_start_fields = tuple(self.required_start_fields)
+        self.required_completion_fields = tuple(self.required_completion_fields)
+        self.controls = tuple(self.controls)
+        self.reagents = tuple(dict(reagent) for reagent in self.reagents)
+        self._required_start_set = frozenset(self.required_start_fields)
+        self._required_completion_set = frozenset(self.required_completion_fields)
+        self._min_duration_ns = _seconds_to_ns(self.min_duration_seconds)
+        self._max_duration_ns = _seconds_to_ns(self.max_duration_seconds)
+
+    @classmethod
+    def _from_yaml(cls, step: dict[str, object]) -> StepTemplate:
+        """Build a step from a parsed template entry; absent list fields share the empty default."""
+        get = step.get
+        min_minutes = get("min_duration_minutes")
+        max_minutes = get("max_duration_minutes")
+        return cls(
+            sys.intern(step["name"]),
+            get("required_start_fields") or (),
+            get("required_completion_fields") or (),
+            None if min_minutes is None else int(min_minutes) * 60,
+            None if max_minutes is None else int(max_minutes) * 60,
+            get("controls") or (),
+            get("reagents") or (),
+        )
 
 
-@dataclass
+@dataclass(slots=True)
 class StepRecord:
     definition: StepTemplate
     operator: str
     started_at: datetime
-    start_data: Dict[str, str]
-    completed_at: Optional[datetime] = None
-    completion_data: Dict[str, str] = field(default_factory=dict)
-    signature: Optional[str] = None
+    start_data: dict[str, str]
+    # Monotonic clock reading used for duration checks; started_at is for display only.
+    started_at_ns: int = field(default_factory=time.monotonic_ns)
+    completed_at: datetime | None = None
+    completion_data: Mapping[str, str] = field(default_factory=dict)
+    signature: str | None = None
+    _summary_cache: dict[str, object] | None = field(default=None, repr=False, compare=False)
 
     @property
     def name(self) -> str:
         return self.definition.name
 
+    def summarize(self) -> dict[str, object]:
+        return {
+            "name": self.name,
+            "operator": self.operator,
+            "started_at": self.started_at.isoformat(),
+            "start_data": self.start_data,
+            "completed": self.completed_at is not None,
+            "completion_data": dict(self.completion_data),
+            "signature": self.signature or "",
+        }
+
 
-@dataclass
+@dataclass(slots=True)
 class SOPWorkflow:
-    templates: List[StepTemplate]
-    _records: List[StepRecord] = field(default_factory=list)
+    templates: list[StepTemplate]
+    _records: list[StepRecord] = field(default_factory=list)
     _current_index: int = 0
+    _requirements_cache: tuple[Mapping[str, object], ...] | None = field(default=None, repr=False, compare=False)
 
-    def start_next_step(self, operator: str, inputs: Dict[str, str]) -> StepRecord:
+    def start_next_step(self, operator: str, inputs: dict[str, str]) -> StepRecord:
         if self._current_index >= len(self.templates):
             raise IndexError("All steps completed")
 
         definition = self.templates[self._current_index]
-        missing_fields = [field for field in definition.required_start_fields if field not in inputs]
+        missing_fields = definition._required_start_set - inputs.keys()
         if missing_fields:
-            raise ValueError(f"Missing required start fields: {', '.join(missing_fields)}")
+            names = [name for name in definition.required_start_fields if name in missing_fields]
+            raise ValueError(f"Missing required start fields: {', '.join(names)}")
 
         record = StepRecord(
             definition=definition,
             operator=operator,
             started_at=datetime.utcnow(),
             start_data=inputs,
+            started_at_ns=time.monotonic_ns(),
         )
         self._records.append(record)
         return record
 
-    def sign_off_step(self, signature: str, completion_inputs: Optional[Dict[str, str]] = None) -> StepRecord:
-        completion_inputs = completion_inputs or {}
+    def sign_off_step(self, signature: str, completion_inputs: Mapping[str, str] | None = None) -> StepRecord:
         if self._current_index >= len(self._records):
             raise ValueError("No step started")
         record = self._records[self._current_index]
         if record.completed_at is not None:
             raise ValueError("Step already signed")
+        if completion_inputs is None:
+            # Keep the record's own empty mapping instead of allocating another one.
+            completion_inputs = record.completion_data
 
-        missing_fields = [
-            field for field in record.definition.required_completion_fields if field not in completion_inputs
-        ]
+        missing_fields = record.definition._required_completion_set - completion_inputs.keys()
         if missing_fields:
-            raise ValueError(f"Missing required completion fields: {', '.join(missing_fields)}")
+            names = [name for name in record.definition.required_completion_fields if name in missing_fields]
+            raise ValueError(f"Missing required completion fields: {', '.join(names)}")
 
-        now = datetime.utcnow()
-        duration = now - record.started_at
+        elapsed_ns = time.monotonic_ns() - record.started_at_ns
+        definition = record.definition
 
-        if record.definition.min_duration_seconds is not None and duration < timedelta(
-            seconds=record.definition.min_duration_seconds
-        ):
+        if definition._min_duration_ns is not None and elapsed_ns < definition._min_duration_ns:
             raise ValueError("Step completed too quickly")
 
-        if record.definition.max_duration_seconds is not None and duration > timedelta(
-            seconds=record.definition.max_duration_seconds
-        ):
+        if definition._max_duration_ns is not None and elapsed_ns > definition._max_duration_ns:
             raise ValueError("Step exceeded maximum duration")
 
-        record.completed_at = now
+        record.completed_at = datetime.utcnow()
         record.completion_data = completion_inputs
         record.signature = signature
+        # Signed records are final, so their summary entry is built once here.
+        record._summary_cache = record.summarize()
         self._current_index += 1
         return record
 
-    def summary(self) -> List[Dict[str, str]]:
+    def summary(self) -> list[dict[str, str]]:
+        # Copy cached entries so callers cannot edit the record of a signed step.
         return [
-            {
-                "name": record.name,
-                "operator": record.operator,
-                "started_at": record.started_at.isoformat(),
-                "start_data": record.start_data,
-                "completed": record.completed_at is not None,
-                "completion_data": record.completion_data,
-                "signature": record.signature or "",
-            }
+            dict(record._summary_cache) if record._summary_cache is not None else record.summarize()
             for record in self._records
         ]
 
-    def step_requirements(self) -> List[Dict[str, object]]:
-        return [
-            {
-                "name": template.name,
-                "required_start_fields": template.required_start_fields,
-                "required_completion_fields": template.required_completion_fields,
-                "min_duration_seconds": template.min_duration_seconds,
-                "max_duration_seconds": template.max_duration_seconds,
-                "controls": template.controls,
-                "reagents": template.reagents,
-            }
+    def step_requirements(self) -> tuple[Mapping[str, object], ...]:
+        """Per-step requirements as read-only mappings; templates are fixed at creation, so this is built once."""
+        if self._requirements_cache is None:
+            self._requirements_cache = self._build_requirements()
+        return self._requirements_cache
+
+    def _build_requirements(self) -> tuple[Mapping[str, object], ...]:
+        return tuple(
+            MappingProxyType(
+                {
+                    "name": template.name,
+                    "required_start_fields": template.required_start_fields,
+                    "required_completion_fields": template.required_completion_fields,
+                    "min_duration_seconds": template.min_duration_seconds,
+                    "max_duration_seconds": template.max_duration_seconds,
+                    "controls": template.controls,
+                    "reagents": template.reagents,
+                }
+            )
             for template in self.templates
-        ]
+        )
 
 
 class TemplateLibrary:
     """Loads SOP templates from YAML/JSON definitions."""
 
-    def __init__(self, template_dir: Optional[Path] = None):
-        base_dir = template_dir or Path(__file__).parent / "templates"
+    def __init__(self, template_dir: Path | None = None):
+        base_dir = template_dir or _BUNDLED_TEMPLATE_DIR
         self.template_dir = Path(base_dir)
+        self._use_sidecars = self.template_dir.resolve() != _BUNDLED_TEMPLATE_DIR.resolve()
+        self._cache: dict[Path, tuple[int, int, tuple[StepTemplate, ...]]] = {}
+        self._dir_index: dict[str, Path] | None = None
+        self._dir_mtime_ns: int | None = None
 
-    def get_template(self, template_name: str) -> List[StepTemplate]:
+    def get_template(self, template_name: str) -> list[StepTemplate]:
+        """Return the template's steps, re-parsing only when the file's mtime or size changed."""
         template_path = self._resolve_template_path(template_name)
+        stat = template_path.stat()
+        cached = self._cache.get(template_path)
+        if cached is not None and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+            return list(cached[2])
+        steps = self._load_template(template_path, stat.st_mtime_ns, stat.st_size)
+        self._cache[template_path] = (stat.st_mtime_ns, stat.st_size, steps)
+        return list(steps)
+
+    def clear(self) -> None:
+        """Drop all cached templates."""
+        self._cache.clear()
+
+    def _load_template(self, template_path: Path, source_mtime_ns: int, source_size: int) -> tuple[StepTemplate, ...]:
+        raw = self._read_definition(template_path, source_mtime_ns, source_size)
+        return tuple(StepTemplate._from_yaml(step) for step in raw.get("steps", []))
+
+    def _read_definition(self, template_path: Path, source_mtime_ns: int, source_size: int) -> dict[str, object]:
+        """Parse a template, preferring its ``.json.cache`` sidecar when it was built from this exact file."""
+        if template_path.suffix == ".json":
+            with template_path.open() as f:
+                return json.load(f)
+        if not self._use_sidecars:
+            with template_path.open() as f:
+                return yaml.load(f, Loader=_YAML_LOADER)
+        sidecar = template_path.with_name(f"{template_path.stem}.json.cache")
+        try:
+            with sidecar.open() as f:
+                cached = json.load(f)
+            # A restored file can keep an old mtime, so "newer than" is not enough; match exactly.
+            if cached["source_mtime_ns"] == source_mtime_ns and cached["source_size"] == source_size:
+                return cached["definition"]
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
         with template_path.open() as f:
-            raw = yaml.safe_load(f)
-        steps: List[StepTemplate] = []
-        for step in raw.get("steps", []):
-            steps.append(
-                StepTemplate(
-                    name=step["name"],
-                    required_start_fields=step.get("required_start_fields", []),
-                    required_completion_fields=step.get("required_completion_fields", []),
-                    min_duration_seconds=self._parse_duration(step, "min_duration_minutes"),
-                    max_duration_seconds=self._parse_duration(step, "max_duration_minutes"),
-                    controls=step.get("controls", []),
-                    reagents=step.get("reagents", []),
-                )
-            )
-        return steps
+            raw = yaml.load(f, Loader=_YAML_LOADER)
+        self._write_sidecar(sidecar, raw, source_mtime_ns, source_size)
+        return raw
+
+    def _write_sidecar(self, sidecar: Path, raw: dict[str, object], source_mtime_ns: int, source_size: int) -> None:
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=sidecar.parent, suffix=".tmp")
+        except OSError:  # read-only template directory
+            return
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump({"source_mtime_ns": source_mtime_ns, "source_size": source_size, "definition": raw}, f)
+            os.replace(tmp_path, sidecar)
+        except (OSError, TypeError, ValueError):
+            # Values YAML can express but JSON cannot (e.g. dates) just skip the sidecar.
+            os.remove(tmp_path)
 
     def _resolve_template_path(self, template_name: str) -> Path:
-        path = self.template_dir / f"{template_name}.yaml"
-        if path.exists():
-            return path
-        path = self.template_dir / f"{template_name}.yml"
-        if path.exists():
-            return path
-        path = self.template_dir / f"{template_name}.json"
-        if path.exists():
-            return path
-        raise FileNotFoundError(f"Template {template_name} not found in {self.template_dir}")
-
-    def _parse_duration(self, step: Dict[str, object], key: str) -> Optional[int]:
-        minutes = step.get(key)
-        if minutes is None:
-            return None
-        return int(minutes) * 60
+        path = self._template_index().get(template_name)
+        if path is None:
+            raise FileNotFoundError(f"Template {template_name} not found in {self.template_dir}")
+        return path
+
+    def _template_index(self) -> dict[str, Path]:
+        """Map template names to files from one directory scan, redone when the directory changes."""
+        try:
+            dir_mtime_ns = os.stat(self.template_dir).st_mtime_ns
+        except OSError:
+            return {}
+        if self._dir_index is None or dir_mtime_ns != self._dir_mtime_ns:
+            candidates: dict[str, dict[str, Path]] = {}
+            with os.scandir(self.template_dir) as entries:
+                for entry in entries:
+                    stem, suffix = os.path.splitext(entry.name)
+                    if suffix in _TEMPLATE_SUFFIXES and entry.is_file():
+                        candidates.setdefault(stem, {})[suffix] = Path(entry.path)
+            self._dir_index = {
+                stem: next(paths[suffix] for suffix in _TEMPLATE_SUFFIXES if suffix in paths)
+                for stem, paths in candidates.items()
+            }
+            self._dir_mtime_ns = dir_mtime_ns
+        return self._dir_index
 
 
 class WorkflowService:
     """Step-enforcing service tracking operator metadata and signatures."""
 
-    def __init__(self, template_library: Optional[TemplateLibrary] = None):
-        self._workflows: Dict[str, SOPWorkflow] = {}
-        self.template_library = template_library or TemplateLibrary()
+    _default_library: ClassVar[TemplateLibrary | None] = None
+
+    def __init__(self, template_library: TemplateLibrary | None = None):
+        self._workflows: dict[str, SOPWorkflow] = {}
+        self.template_library = template_library or self._shared_library()
+
+    @classmethod
+    def _shared_library(cls) -> TemplateLibrary:
+        # Services built per run share one library so bundled templates are parsed once.
+        if cls._default_library is None:
+            cls._default_library = TemplateLibrary()
+        return cls._default_library
 
-    def create_workflow(self, workflow_id: str, steps: List[str]) -> SOPWorkflow:
+    def create_workflow(self, workflow_id: str, steps: Sequence[str]) -> SOPWorkflow:
         if workflow_id in self._workflows:
             raise KeyError("Workflow already exists")
-        templates = [StepTemplate(name=step) for step in steps]
-        self._workflows[workflow_id] = SOPWorkflow(templates=templates)
-        return self._workflows[workflow_id]
+        templates = [StepTemplate(name=sys.intern(step)) for step in steps]
+        workflow = self._workflows[workflow_id] = SOPWorkflow(templates=templates)
+        return workflow
 
     def create_workflow_from_template(self, workflow_id: str, template_name: str) -> SOPWorkflow:
         if workflow_id in self._workflows:
             raise KeyError("Workflow already exists")
         templates = self.template_library.get_template(template_name)
-        self._workflows[workflow_id] = SOPWorkflow(templates=templates)
-        return self._workflows[workflow_id]
+        workflow = self._workflows[workflow_id] = SOPWorkflow(templates=templates)
+        return workflow
 
-    def record_step_start(self, workflow_id: str, operator: str, inputs: Dict[str, str]) -> StepRecord:
+    def record_step_start(self, workflow_id: str, operator: str, inputs: dict[str, str]) -> StepRecord:
         workflow = self._get_workflow(workflow_id)
         return workflow.start_next_step(operator, inputs)
 
-    def record_step_signature(self, workflow_id: str, signature: str, completion_inputs: Optional[Dict[str, str]] = None) -> StepRecord:
+    def record_step_signature(self, workflow_id: str, signature: str, completion_inputs: Mapping[str, str] | None = None) -> StepRecord:
         workflow = self._get_workflow(workflow_id)
         return workflow.sign_off_step(signature, completion_inputs)
 
-    def get_workflow_summary(self, workflow_id: str) -> List[Dict[str, str]]:
+    def get_workflow_summary(self, workflow_id: str) -> list[dict[str, str]]:
         return self._get_workflow(workflow_id).summary()
 
-    def get_workflow_requirements(self, workflow_id: str) -> List[Dict[str, object]]:
+    def get_workflow_requirements(self, workflow_id: str) -> tuple[Mapping[str, object], ...]:
         return self._get_workflow(workflow_id).step_requirements()
 
     def _get_workflow(self, workflow_id: str) -> SOPWorkflow:
-        if workflow_id not in self._workflows:
+        workflow = self._workflows.get(workflow_id)
+        if workflow is None:
             raise KeyError("Workflow not found")
-        return self._workflows[workflow_id]
+        return workflow
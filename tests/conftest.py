@@ -1,6 +1,11 @@
+import os
 import sys
+import tempfile
 from pathlib import Path
 
 ROOT = Path(__file__).resolve().parent.parent
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
+
+# Keep server-side sessions created by the frontend tests out of the working tree.
+os.environ.setdefault("FRONTEND_SESSION_DIR", tempfile.mkdtemp(prefix="lims-frontend-sessions-"))
@@ -1,6 +1,22 @@
+import numpy as np
 import pytest
+from scipy import optimize
 
-from analytics.curve_fitting import fit_4pl, fit_5pl, four_parameter_logistic, plot_curve
+from analytics.curve_fitting import (
+    _jacobian_4pl,
+    _jacobian_5pl,
+    _jacobian_5pl_loop,
+    _predict_4pl,
+    _predict_4pl_loop,
+    _predict_5pl,
+    _predict_5pl_loop,
+    fit_4pl,
+    fit_4pl_multistart,
+    fit_5pl,
+    five_parameter_logistic,
+    four_parameter_logistic,
+    plot_curve,
+)
 
 
 def test_fit_4pl_returns_parameters_and_predictions():
@@ -50,7 +66,7 @@ def test_fit_4pl_rejects_non_positive_concentrations():
 def test_fit_handles_repeated_points():
     xs = [1.0, 1.0, 1.0]
     ys = [four_parameter_logistic(x, 0.1, 1.0, 1.5, 2.0) for x in xs]
-    result = fit_4pl(xs, ys, backend="gradient")
+    result = fit_4pl(xs, ys)
     assert len(result.predictions) == len(xs)
     assert result.status
 
@@ -58,6 +74,97 @@ def test_fit_handles_repeated_points():
 def test_fit_reports_non_convergence():
     xs = [0.5, 1.0, 2.0]
     ys = [1.0, 1.1, 1.2]
-    result = fit_4pl(xs, ys, backend="gradient", max_iterations=1, tolerance=1e-12)
+    result = fit_4pl(xs, ys, max_iterations=1, tolerance=1e-12)
     assert result.converged is False
     assert "maximum iterations" in result.status.lower()
+
+
+def test_fit_rejects_unknown_backend():
+    with pytest.raises(ValueError, match="backend"):
+        fit_4pl([0.5, 1.0, 2.0], [1.0, 1.1, 1.2], backend="gradient")
+
+
+def test_fit_accepts_scipy_backend_alias():
+    xs = [0.1, 0.5, 1.0, 2.0, 5.0]
+    ys = [four_parameter_logistic(x, 0.05, 1.2, 2.0, 1.0) for x in xs]
+    assert fit_4pl(xs, ys, backend="scipy") == fit_4pl(xs, ys, backend="least_squares")
+
+
+def test_logistic_models_accept_arrays():
+    xs = [0.5, 1.0, 2.0]
+    vectorized = four_parameter_logistic(xs, 0.05, 1.2, 2.0, 1.0)
+    assert vectorized.shape == (3,)
+    for x, y in zip(xs, vectorized):
+        assert y == pytest.approx(float(four_parameter_logistic(x, 0.05, 1.2, 2.0, 1.0)))
+
+
+def test_analytic_jacobians_match_numerical_derivatives():
+    xs = np.array([0.1, 0.5, 1.0, 2.0, 5.0])
+    params = [0.05, 1.2, 2.0, 1.0, 0.8]
+    for model, jacobian, n_params in (
+        (four_parameter_logistic, _jacobian_4pl, 4),
+        (five_parameter_logistic, _jacobian_5pl, 5),
+    ):
+        p = params[:n_params]
+        numerical = np.column_stack(
+            [
+                optimize.approx_fprime(p, lambda q, x=x: float(model(x, *q)), 1e-7)
+                for x in xs
+            ]
+        ).T
+        assert np.allclose(jacobian(np.log(xs), *p), numerical, atol=1e-5)
+
+
+def test_fit_basinhopping_backend_matches_local_fit():
+    xs = [0.1, 0.5, 1.0, 2.0, 5.0]
+    ys = [four_parameter_logistic(x, 0.05, 1.2, 2.0, 1.0) for x in xs]
+    result = fit_4pl(xs, ys, backend="basinhopping", niter=10, seed=0)
+    assert result.converged is True
+    assert "basin-hopping" in result.status.lower()
+    assert result.r_squared > 0.95
+    assert result.parameters["c"] > 0
+
+
+def test_fit_4pl_multistart_returns_best_fit():
+    xs = [0.1, 0.5, 1.0, 2.0, 5.0]
+    ys = [four_parameter_logistic(x, 0.05, 1.2, 2.0, 1.0) for x in xs]
+    result = fit_4pl_multistart(xs, ys, n_starts=4, processes=2, seed=0)
+    assert result.model == "4PL"
+    assert result.r_squared >= fit_4pl(xs, ys).r_squared - 1e-9
+    assert "best of 4 starts" in result.status
+
+
+def test_log_space_kernels_match_public_models():
+    xs = np.array([0.1, 0.5, 1.0, 2.0, 5.0])
+    log_x = np.log(xs)
+    assert np.allclose(_predict_4pl(log_x, 0.05, 1.2, 2.0, 1.0), four_parameter_logistic(xs, 0.05, 1.2, 2.0, 1.0))
+    assert np.allclose(
+        _predict_5pl(log_x, 0.05, 1.2, 2.0, 1.0, 0.8), five_parameter_logistic(xs, 0.05, 1.2, 2.0, 1.0, 0.8)
+    )
+
+
+def test_loop_kernels_match_vectorized_kernels():
+    log_x = np.log(np.array([0.1, 0.5, 1.0, 2.0, 5.0]))
+    params = (0.05, 1.2, 2.0, 1.0, 0.8)
+    assert np.allclose(_predict_4pl_loop(log_x, *params[:4]), _predict_4pl(log_x, *params[:4]))
+    assert np.allclose(_predict_5pl_loop(log_x, *params), _predict_5pl(log_x, *params))
+    assert np.allclose(_jacobian_5pl_loop(log_x, *params), _jacobian_5pl(log_x, *params))
+
+
+def test_fit_result_stores_predictions_column_wise():
+    xs = [0.1, 0.5, 1.0, 2.0, 5.0]
+    ys = [four_parameter_logistic(x, 0.05, 1.2, 2.0, 1.0) for x in xs]
+    result = fit_4pl(xs, ys)
+    assert isinstance(result.xs, np.ndarray)
+    assert result.xs.tolist() == xs
+    assert result.predictions == list(zip(result.xs.tolist(), result.ys.tolist()))
+    assert result == fit_4pl(xs, ys)
+    assert result != fit_5pl(xs, ys)
+
+
+def test_repeated_standards_share_prepared_concentrations():
+    xs = [0.1, 0.5, 1.0, 2.0, 5.0]
+    first = fit_4pl(xs, [0.1, 0.3, 0.5, 0.8, 0.95])
+    second = fit_5pl(xs, [0.12, 0.31, 0.52, 0.79, 0.96])
+    assert first.xs is second.xs
+    assert not first.xs.flags.writeable
@@ -1,4 +1,6 @@
-from connectors.liquid_handler import MockLiquidHandler, Transfer
+import pytest
+
+from connectors.liquid_handler import OP_TRANSFER, MockLiquidHandler, Transfer
 from connectors.plate_reader import parse_plate_csv
 
 
@@ -17,4 +19,23 @@ def test_mock_liquid_handler_tracks_volumes():
     handler.transfer(Transfer(source="A1", destination="B1", volume_ul=25))
     assert handler.summary()["A1"] == 75
     assert handler.summary()["B1"] == 25
-    assert any(entry.startswith("transfer") for entry in handler.audit_log)
+    assert handler.formatted_audit() == ["load:A1:100", "transfer:A1->B1:25"]
+
+
+def test_plate_reader_parser_stores_values_column_wise(tmp_path):
+    csv_path = tmp_path / "plate.csv"
+    csv_path.write_text("well,value\nA1,0.5\n,0.7\nB1,1.2\n\nC1\nD1,\nE1, \n")
+    run = parse_plate_csv(str(csv_path), instrument="BioTek", assay="IgG")
+    assert run.wells == ["A1", "B1"]
+    assert run.values.tolist() == [0.5, 1.2]
+    assert [reading.value for reading in run.readings] == [0.5, 1.2]
+    assert run == parse_plate_csv(str(csv_path), instrument="BioTek", assay="IgG")
+
+
+def test_mock_liquid_handler_rejects_overdraw_without_side_effects():
+    handler = MockLiquidHandler()
+    handler.load_well("A1", 10)
+    with pytest.raises(ValueError, match="Insufficient volume"):
+        handler.transfer(Transfer(source="C1", destination="B1", volume_ul=5))
+    assert handler.summary() == {"A1": 10}
+    assert all(event[0] != OP_TRANSFER for event in handler.audit_log)
@@ -0,0 +1,126 @@
+import io
+
+import pytest
+
+import frontend
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    upload_folder = tmp_path / "uploads"
+    monkeypatch.setitem(frontend.app.config, "UPLOAD_FOLDER", str(upload_folder))
+    monkeypatch.setitem(frontend.app.config, "TESTING", True)
+    client = frontend.app.test_client()
+    with client.session_transaction() as session:
+        session["auth"] = {"user_id": "alice", "role": "technician", "token": ""}
+        session["wizard"] = {"assay": "IRT", "instrument": "BioTek", "operator": "alice"}
+    client.upload_folder = upload_folder
+    return client
+
+
+@pytest.fixture
+def journal(monkeypatch):
+    monkeypatch.setattr(frontend, "operator_journal", frontend.deque(maxlen=frontend.OPERATOR_JOURNAL_LIMIT))
+    return frontend.operator_journal
+
+
+def test_format_journal_is_safe_against_concurrent_appends(journal):
+    frontend.record_action("alice", "first")
+    frontend.record_action("alice", "second")
+    lines = frontend.format_journal()
+    assert next(lines).endswith("+00:00 - alice: first")
+
+    frontend.record_action("bob", "during render")
+    assert next(lines).endswith("alice: second")
+    assert list(lines) == []
+
+
+@pytest.mark.parametrize("extra_lines", [1, frontend.PYARROW_MIN_LINES + 5])
+def test_quoted_standards_are_rejected_regardless_of_paste_length(extra_lines):
+    rows = "\n".join(f"{i}.0,{i * 2}.0" for i in range(1, extra_lines + 1))
+    with pytest.raises(ValueError, match="Invalid standard entry"):
+        frontend.parse_standards('"1.0",0.0\n' + rows)
+
+
+def test_streaming_upload_stores_sanitized_file_and_uploader(client, journal):
+    response = client.post(
+        "/wizard/upload",
+        data={"plate_csv": (io.BytesIO(b"Well,Value\nA1,0.5\n"), "../../my plate.csv"), "uploader": "dave"},
+        content_type="multipart/form-data",
+    )
+
+    assert response.status_code == 302
+    assert response.headers["Location"].endswith("/wizard/standards")
+    assert sorted(path.name for path in client.upload_folder.iterdir()) == ["my_plate.csv"]
+    assert (client.upload_folder / "my_plate.csv").read_bytes() == b"Well,Value\nA1,0.5\n"
+    with client.session_transaction() as session:
+        assert session["wizard"]["plate_path"] == str(client.upload_folder / "my_plate.csv")
+        assert session["wizard"]["uploaded_by"] == "dave"
+    assert journal[-1][1:] == ("dave", "загрузил CSV my_plate.csv")
+
+
+@pytest.mark.parametrize("filename", ["", "../.."])
+def test_streaming_upload_without_usable_filename_leaves_no_partial_file(client, filename):
+    response = client.post(
+        "/wizard/upload",
+        data={"plate_csv": (io.BytesIO(b"Well,Value\n"), filename)},
+        content_type="multipart/form-data",
+    )
+
+    assert response.headers["Location"].endswith("/wizard/upload")
+    assert list(client.upload_folder.iterdir()) == []
+    with client.session_transaction() as session:
+        assert "plate_path" not in session["wizard"]
+
+
+def test_non_multipart_upload_uses_form_fallback(client):
+    response = client.post("/wizard/upload", data={"uploader": "dave"})
+    assert response.headers["Location"].endswith("/wizard/upload")
+    assert list(client.upload_folder.iterdir()) == []
+
+    client.upload_folder.mkdir(exist_ok=True)
+    with frontend.app.test_request_context(
+        "/wizard/upload",
+        method="POST",
+        data={"plate_csv": (io.BytesIO(b"Well,Value\n"), "plate.csv"), "uploader": "erin"},
+    ):
+        assert frontend.save_form_upload(str(client.upload_folder)) == ("plate.csv", "erin")
+    assert (client.upload_folder / "plate.csv").read_bytes() == b"Well,Value\n"
+
+
+def test_parse_standards_and_controls():
+    assert frontend.parse_standards("0.1, 0.2\n\n0.5,0.4\n") == [(0.1, 0.2), (0.5, 0.4)]
+    assert frontend.parse_standards("  \n") == []
+    assert frontend.parse_controls("1, 10.2, 10, 0.5\n2,9.8,10,0.5") == [
+        {"run": 1, "value": 10.2, "mean": 10.0, "sd": 0.5},
+        {"run": 2, "value": 9.8, "mean": 10.0, "sd": 0.5},
+    ]
+    with pytest.raises(ValueError, match="Invalid standard entry '0.1,x'"):
+        frontend.parse_standards("0.2,0.3\n0.1,x")
+    with pytest.raises(ValueError, match="Invalid control entry '1,2,3'"):
+        frontend.parse_controls("1,2,3")
+
+
+@pytest.mark.skipif(frontend.pyarrow is None, reason="pyarrow is optional")
+def test_long_pastes_parse_like_short_ones():
+    rows = [(float(i), i * 0.5) for i in range(1, frontend.PYARROW_MIN_LINES + 10)]
+    raw = "\n".join(f" {conc}, {signal} " for conc, signal in rows)
+    assert frontend.parse_standards(raw) == rows
+    with pytest.raises(ValueError, match="Invalid standard entry '1.0,'"):
+        frontend.parse_standards(raw + "\n1.0,")
+
+
+def test_logout_revokes_the_session_token(client):
+    token = frontend.adapter.authenticate("alice", "p@ss", otp="123456")
+    with client.session_transaction() as session:
+        session["auth"]["token"] = token
+
+    client.get("/logout")
+    with pytest.raises(frontend.AuthenticationError):
+        frontend.adapter.create_sample(token, {"type": "serum"})
+
+
+def test_session_store_has_no_eviction_threshold():
+    # cachelib's default threshold of 500 would evict live sessions once exceeded.
+    assert frontend.app.config["SESSION_CACHELIB"]._threshold == 0
+    assert frontend.app.permanent_session_lifetime.total_seconds() == frontend.TOKEN_TTL_SECONDS
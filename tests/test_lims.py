@@ -1,7 +1,10 @@
+import time
 from datetime import datetime
 
+import pytest
+
 from lims.adapter import AuthenticationError, LIMSAdapter
-from lims.config import CFRPart11Policy, LIMSConfig, LIMSContext
+from lims.config import AUDIT_FLUSH_BATCH, AuditTrailEntry, CFRPart11Policy, LIMSConfig, LIMSContext
 
 
 def test_lims_adapter_audit_and_sample_creation():
@@ -34,3 +37,121 @@ def test_authentication_requires_otp():
         pass
     else:
         raise AssertionError("Expected authentication failure without OTP")
+
+
+def test_audit_entries_store_epoch_nanoseconds():
+    context = LIMSContext(
+        config=LIMSConfig(system_name="SENAITE", base_url="http://example", api_key="abc"),
+        policy=CFRPart11Policy(),
+    )
+    adapter = LIMSAdapter(context)
+    adapter.register_user("alice", role="technician", password="p@ss")
+    adapter.authenticate("alice", "p@ss", otp="123456")
+
+    entry = adapter.get_audit_trail()[0]
+    assert isinstance(entry.timestamp, int)
+    assert datetime.fromisoformat(entry.iso).timestamp() == pytest.approx(entry.timestamp / 1e9, abs=1e-3)
+
+
+def test_unknown_token_is_rejected():
+    context = LIMSContext(
+        config=LIMSConfig(system_name="SENAITE", base_url="http://example", api_key="abc"),
+        policy=CFRPart11Policy(),
+    )
+    adapter = LIMSAdapter(context)
+    adapter.register_user("alice", role="technician", password="p@ss")
+    adapter.authenticate("alice", "p@ss", otp="123456")
+
+    with pytest.raises(AuthenticationError):
+        adapter.create_sample("token-alice-0", {"type": "serum"})
+
+
+def test_tokens_are_revoked_and_expire():
+    context = LIMSContext(
+        config=LIMSConfig(system_name="SENAITE", base_url="http://example", api_key="abc"),
+        policy=CFRPart11Policy(),
+    )
+    adapter = LIMSAdapter(context)
+    adapter.register_user("alice", role="technician", password="p@ss")
+    token = adapter.authenticate("alice", "p@ss", otp="123456")
+    adapter.revoke_token(token)
+    with pytest.raises(AuthenticationError):
+        adapter.create_sample(token, {"type": "serum"})
+    assert [entry.action for entry in adapter.get_audit_trail()] == ["login", "logout"]
+
+    adapter.token_ttl_seconds = 0
+    expired = [adapter.authenticate("alice", "p@ss", otp="123456") for _ in range(3)]
+    with pytest.raises(AuthenticationError):
+        adapter.create_sample(expired[-1], {"type": "serum"})
+    assert len(adapter._tokens) <= 1
+
+
+def test_audit_trail_trim_respects_retention_and_sample_ids_stay_unique():
+    context = LIMSContext(
+        config=LIMSConfig(system_name="SENAITE", base_url="http://example", api_key="abc"),
+        policy=CFRPart11Policy(audit_retention_days=1),
+    )
+    adapter = LIMSAdapter(context)
+    adapter.register_user("alice", role="technician", password="p@ss")
+    token = adapter.authenticate("alice", "p@ss", otp="123456")
+    first = adapter.create_sample(token, {"type": "serum"})
+    context.audit_trail.appendleft(
+        AuditTrailEntry(user_id="alice", action="legacy", timestamp=0, signature="sig-alice")
+    )
+
+    assert context.trim() == 1
+    assert context.trim(max_entries=1) == 1
+    assert [entry.action for entry in context.audit_trail] == [f"create_sample:{first}"]
+    assert adapter.create_sample(token, {"type": "serum"}) != first
+
+
+def test_audit_entries_are_batched_until_flush():
+    context = LIMSContext(
+        config=LIMSConfig(system_name="SENAITE", base_url="http://example", api_key="abc"),
+        policy=CFRPart11Policy(),
+    )
+    adapter = LIMSAdapter(context)
+    adapter.register_user("alice", role="technician", password="p@ss")
+    adapter.authenticate("alice", "p@ss", otp="123456")
+
+    assert len(context.audit_trail) == 0
+    assert [entry.action for entry in adapter.get_audit_trail()] == ["login"]
+
+    for idx in range(AUDIT_FLUSH_BATCH):
+        context.record(AuditTrailEntry(user_id="alice", action=f"a{idx}", timestamp=idx, signature="sig"))
+    assert len(context.audit_trail) == AUDIT_FLUSH_BATCH + 1
+
+
+def test_audit_trail_view_and_snapshot():
+    context = LIMSContext(
+        config=LIMSConfig(system_name="SENAITE", base_url="http://example", api_key="abc"),
+        policy=CFRPart11Policy(),
+    )
+    adapter = LIMSAdapter(context)
+    adapter.register_user("alice", role="technician", password="p@ss")
+    token = adapter.authenticate("alice", "p@ss", otp="123456")
+
+    view = adapter.get_audit_trail()
+    snapshot = adapter.snapshot()
+    adapter.approve_record(token, "S-0001", reason="Verified")
+
+    assert view is context.audit_trail
+    assert len(view) == 2
+    assert len(snapshot) == 1
+    assert adapter.get_audit_trail(copy=True) == tuple(view)
+
+
+def test_flush_drops_only_entries_past_retention():
+    context = LIMSContext(
+        config=LIMSConfig(system_name="SENAITE", base_url="http://example", api_key="abc"),
+        policy=CFRPart11Policy(audit_retention_days=1),
+    )
+    context.audit_trail.append(
+        AuditTrailEntry(user_id="alice", action="legacy", timestamp=0, signature="sig-alice")
+    )
+    for index in range(AUDIT_FLUSH_BATCH + 3):
+        context.record(AuditTrailEntry(user_id="alice", action=f"a{index}", timestamp=time.time_ns(), signature="sig"))
+    context.flush()
+
+    assert len(context.audit_trail) == AUDIT_FLUSH_BATCH + 3
+    assert context.audit_trail[0].action == "a0"
@@ -1,6 +1,9 @@
+import copy
 from pathlib import Path
 
-from orchestrator.workflow import build_full_run
+import pytest
+
+from orchestrator.workflow import AuditLogger, WorkflowDAG, build_full_run
 from qc.westgard import ControlResult
 
 
@@ -23,3 +26,30 @@ def test_build_full_run_executes_tasks(tmp_path):
     assert "analysis-and-qc-complete" in names
     assert "qc" in names
     assert any(entry.startswith("executed") for entry in logger.entries)
+    # The frontend hands out deep copies of cached results; records must survive it.
+    copied = copy.deepcopy(dict(results))
+    assert copied["plate-preparation-start"].definition == dict(results)["plate-preparation-start"].definition
+
+
+def test_dag_respects_dependencies_and_returns_declaration_order():
+    dag = WorkflowDAG(AuditLogger())
+    order = []
+    dag.add_task("prepare", lambda: order.append("prepare"))
+    dag.add_task("sign", lambda: order.append("sign"))
+    dag.add_task("fit", lambda: order.append("fit") or "fitted", depends_on=())
+    dag.add_task("report", lambda: order.append("report"), depends_on=("sign", "fit"))
+
+    results = dag.run()
+
+    assert [name for name, _ in results] == ["prepare", "sign", "fit", "report"]
+    assert dict(results)["fit"] == "fitted"
+    assert order.index("prepare") < order.index("sign") < order.index("report")
+    assert order.index("fit") < order.index("report")
+
+
+def test_dag_rejects_cyclic_dependencies():
+    dag = WorkflowDAG(AuditLogger())
+    dag.add_task("a", lambda: None, depends_on=("b",))
+    dag.add_task("b", lambda: None)
+    with pytest.raises(ValueError, match="Cyclic"):
+        dag.run()
@@ -1,4 +1,19 @@
-from qc.westgard import ControlResult, check_westgard, levey_jennings_points
+import dataclasses
+import random
+
+import numpy as np
+import pytest
+
+from qc.westgard import (
+    RULES,
+    VECTORIZE_THRESHOLD,
+    ControlResult,
+    _check_westgard_scalar,
+    _check_westgard_vectorized,
+    _westgard_kernel,
+    check_westgard,
+    levey_jennings_points,
+)
 
 
 def test_westgard_rules_detect_breaches():
@@ -46,3 +61,33 @@ def test_r_4s_detects_large_opposite_shifts():
     breaches = check_westgard(results)
 
     assert breaches["r_4s"] == [1]
+
+
+def test_vectorized_westgard_matches_scalar_rules():
+    rng = random.Random(7)
+    results = [
+        ControlResult(run=i, value=rng.gauss(3 if 100 <= i < 130 else 0, 1.6), mean=0, sd=0 if i == 40 else 1)
+        for i in range(500)
+    ]
+    assert len(results) > VECTORIZE_THRESHOLD
+    assert check_westgard(results)["10_x"]
+    assert check_westgard(results) == _check_westgard_scalar(results)
+    assert _check_westgard_vectorized(results) == _check_westgard_scalar(results)
+
+
+def test_westgard_kernel_matches_scalar_rules():
+    rng = random.Random(11)
+    results = [
+        ControlResult(run=i, value=rng.gauss(3 if 50 <= i < 80 else 0, 1.6), mean=0, sd=1) for i in range(300)
+    ]
+    indices, counts = _westgard_kernel(np.array([r.z_score for r in results]))
+    kernel_breaches = {rule: indices[i, : counts[i]].tolist() for i, rule in enumerate(RULES)}
+    assert kernel_breaches == _check_westgard_scalar(results)
+
+
+def test_control_result_precomputes_z_score_and_is_immutable():
+    result = ControlResult(run=1, value=12, mean=10, sd=0.5)
+    assert result.z_score == 4.0
+    assert ControlResult(run=2, value=12, mean=10, sd=0).z_score == 0.0
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        result.value = 11
@@ -1,8 +1,15 @@
-from datetime import datetime, timedelta
+import copy
+import json
+import os
+import pickle
+import time
+from datetime import datetime
+from pathlib import Path
 
 import pytest
 
-from sop_runner.workflow import TemplateLibrary, WorkflowService
+from sop_runner import workflow as sop_workflow
+from sop_runner.workflow import StepRecord, StepTemplate, TemplateLibrary, WorkflowService
 
 
 def test_workflow_enforces_step_order():
@@ -20,6 +27,8 @@ def test_workflow_enforces_step_order():
     summary = service.get_workflow_summary("run-1")
     assert len(summary) == 2
     assert summary[0]["completed"] is True
+    summary[0]["signature"] = "TAMPERED"
+    assert service.get_workflow_summary("run-1")[0]["signature"] == "sig1"
 
 
 def test_template_driven_workflow_exposes_requirements():
@@ -28,9 +37,15 @@ def test_template_driven_workflow_exposes_requirements():
 
     requirements = service.get_workflow_requirements("elisa-run")
     assert len(requirements) == 3
-    assert requirements[0]["required_start_fields"] == ["operator", "reagent_lot"]
+    assert requirements[0]["required_start_fields"] == ("operator", "reagent_lot")
     assert "controls" in requirements[1]
     assert "reagents" in requirements[0]
+    assert service.get_workflow_requirements("elisa-run") is requirements
+    with pytest.raises(TypeError):
+        requirements[0]["controls"] = []
+    assert isinstance(requirements[1]["controls"], tuple)
+    with pytest.raises(AttributeError):
+        requirements[0]["required_start_fields"].append("analyst")
 
 
 def test_step_cannot_complete_without_required_fields(tmp_path):
@@ -58,8 +73,108 @@ steps:
         service.record_step_signature("custom-run", signature="sig")
 
     # simulate incubation for longer than required minimum
-    record.started_at = datetime.utcnow() - timedelta(minutes=2)
+    record.started_at_ns -= 2 * 60 * 1_000_000_000
     completed = service.record_step_signature(
         "custom-run", signature="sig", completion_inputs={"incubation_time_minutes": "2"}
     )
     assert completed.signature == "sig"
+
+
+def test_template_library_parses_each_template_once():
+    assert WorkflowService().template_library is WorkflowService().template_library
+
+    library = TemplateLibrary()
+    first = library.get_template("elisa_basic")
+    second = library.get_template("elisa_basic")
+    assert first == second
+    assert first is not second
+    assert all(a is b for a, b in zip(first, second))
+
+
+def test_template_cache_reloads_changed_files(tmp_path):
+    template = tmp_path / "cached.yaml"
+    template.write_text("steps:\n  - name: prep\n")
+    library = TemplateLibrary(template_dir=tmp_path)
+    assert [step.name for step in library.get_template("cached")] == ["prep"]
+
+    template.write_text("steps:\n  - name: prep\n  - name: measure\n")
+    assert [step.name for step in library.get_template("cached")] == ["prep", "measure"]
+
+    library.clear()
+    assert [step.name for step in library.get_template("cached")] == ["prep", "measure"]
+
+
+def test_template_json_sidecar_is_written_and_reused(tmp_path):
+    template = tmp_path / "sidecar.yaml"
+    template.write_text("steps:\n  - name: prep\n    min_duration_minutes: 2\n")
+    TemplateLibrary(template_dir=tmp_path).get_template("sidecar")
+
+    sidecar = tmp_path / "sidecar.json.cache"
+    cached = json.loads(sidecar.read_text())
+    assert cached["definition"] == {"steps": [{"name": "prep", "min_duration_minutes": 2}]}
+    assert cached["source_size"] == template.stat().st_size
+
+    cached["definition"] = {"steps": [{"name": "from-sidecar"}]}
+    sidecar.write_text(json.dumps(cached))
+    steps = TemplateLibrary(template_dir=tmp_path).get_template("sidecar")
+    assert [step.name for step in steps] == ["from-sidecar"]
+
+
+def test_template_sidecar_ignored_for_restored_older_file(tmp_path):
+    template = tmp_path / "restored.yaml"
+    template.write_text("steps:\n  - name: current\n")
+    TemplateLibrary(template_dir=tmp_path).get_template("restored")
+
+    # Restoring an older revision with its original mtime (cp -p, rsync -t, tar) predates the sidecar.
+    template.write_text("steps:\n  - name: restored\n")
+    os.utime(template, ns=(1_000_000_000, 1_000_000_000))
+    steps = TemplateLibrary(template_dir=tmp_path).get_template("restored")
+    assert [step.name for step in steps] == ["restored"]
+
+
+def test_bundled_templates_do_not_get_sidecars():
+    TemplateLibrary().get_template("elisa_basic")
+    assert not (Path(sop_workflow.__file__).parent / "templates" / "elisa_basic.json.cache").exists()
+
+
+def test_template_resolution_prefers_yaml_and_sees_new_files(tmp_path):
+    (tmp_path / "dup.json").write_text(json.dumps({"steps": [{"name": "json"}]}))
+    (tmp_path / "dup.yaml").write_text("steps:\n  - name: yaml\n")
+    library = TemplateLibrary(template_dir=tmp_path)
+    assert [step.name for step in library.get_template("dup")] == ["yaml"]
+
+    with pytest.raises(FileNotFoundError):
+        library.get_template("late")
+    (tmp_path / "late.yml").write_text("steps:\n  - name: late\n")
+    assert [step.name for step in library.get_template("late")] == ["late"]
+
+
+def test_template_backed_records_can_be_deep_copied():
+    service = WorkflowService()
+    service.create_workflow_from_template("copy-run", "elisa_basic")
+    record = service.record_step_start(
+        "copy-run", operator="alice", inputs={"operator": "alice", "reagent_lot": "L1"}
+    )
+
+    clone = copy.deepcopy(record)
+    assert clone.definition == record.definition
+    assert clone.start_data == record.start_data and clone.start_data is not record.start_data
+    assert pickle.loads(pickle.dumps(record.definition)) == record.definition
+
+
+def test_steps_signed_without_inputs_summarize_to_json_and_copy():
+    service = WorkflowService()
+    service.create_workflow("plain-run", ["prep"])
+    service.record_step_start("plain-run", operator="alice", inputs={})
+    record = service.record_step_signature("plain-run", signature="sig")
+
+    summary = service.get_workflow_summary("plain-run")
+    assert json.loads(json.dumps(summary))[0]["completion_data"] == {}
+    clone = copy.deepcopy(record)
+    assert clone.completion_data == {} and clone.signature == "sig"
+
+
+def test_step_record_defaults_to_the_current_monotonic_reading():
+    before = time.monotonic_ns()
+    record = StepRecord(definition=StepTemplate(name="prep"), operator="alice", started_at=datetime.utcnow(), start_data={})
+    assert before <= record.started_at_ns <= time.monotonic_ns()